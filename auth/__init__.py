@@ -8,14 +8,18 @@ from .config import (
     BasicAuthConfig,
     FormAuthConfig,
     TokenAuthConfig,
-    AuthConfigManager
+    AuthConfigManager,
+    register_config
 )
 from .handlers import (
     AuthHandler,
     BasicAuthHandler,
     FormAuthHandler,
     TokenAuthHandler,
-    create_auth_handler
+    LoginSpec,
+    batch_authenticate,
+    create_auth_handler,
+    register_handler
 )
 from .storage import CredentialManager
 from .utils import (
@@ -34,13 +38,17 @@ __all__ = [
     'FormAuthConfig',
     'TokenAuthConfig',
     'AuthConfigManager',
+    'register_config',
     
     # Handler classes
     'AuthHandler',
     'BasicAuthHandler',
     'FormAuthHandler',
     'TokenAuthHandler',
+    'LoginSpec',
+    'batch_authenticate',
     'create_auth_handler',
+    'register_handler',
     
     # Storage
     'CredentialManager',
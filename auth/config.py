@@ -2,10 +2,29 @@
 Configuration system for authentication settings.
 Uses Pydantic for validation and type checking.
 """
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping, Optional
 from pydantic import BaseModel, Field, validator
 from .storage import CredentialManager
 
+# Config model for each supported auth type, filled in by register_config
+_CONFIG_CLASSES: Dict[str, type] = {}
+
+def register_config(auth_type: str):
+    """
+    Class decorator registering an AuthConfig subclass for an auth type.
+    
+    Args:
+        auth_type: Auth type name the config describes (case-insensitive)
+        
+    Returns:
+        Decorator that registers and returns the class unchanged
+    """
+    def decorator(config_class: type) -> type:
+        _CONFIG_CLASSES[auth_type.casefold()] = config_class
+        return config_class
+    return decorator
+
 class AuthConfig(BaseModel):
     """Base configuration for authentication."""
     auth_type: str = Field(..., description="Type of authentication (basic, form, token)")
@@ -14,14 +33,16 @@ class AuthConfig(BaseModel):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     verify_ssl: bool = Field(default=True, description="Whether to verify SSL certificates")
 
+@register_config('basic')
 class BasicAuthConfig(AuthConfig):
     """Configuration for basic authentication."""
-    auth_type: str = Field(default="basic", const=True)
+    auth_type: Literal["basic"] = "basic"
     auth_url: str = Field(..., description="URL for basic auth")
 
+@register_config('form')
 class FormAuthConfig(AuthConfig):
     """Configuration for form-based authentication."""
-    auth_type: str = Field(default="form", const=True)
+    auth_type: Literal["form"] = "form"
     form_url: str = Field(..., description="URL of the login form")
     form_data: Dict[str, str] = Field(
         default_factory=dict,
@@ -32,9 +53,10 @@ class FormAuthConfig(AuthConfig):
         description="URL to verify successful login"
     )
 
+@register_config('token')
 class TokenAuthConfig(AuthConfig):
     """Configuration for token-based authentication."""
-    auth_type: str = Field(default="token", const=True)
+    auth_type: Literal["token"] = "token"
     token_url: str = Field(..., description="URL to obtain token")
     token_field: str = Field(
         default="token",
@@ -57,6 +79,14 @@ class AuthConfigManager:
         """
         self.credential_manager = credential_manager
         self._configs: Dict[str, AuthConfig] = {}
+        # Lower-cased service name -> registered name, for case-insensitive lookups
+        self._names_by_lower: Dict[str, str] = {}
+        self._configs_view = MappingProxyType(self._configs)
+    
+    @property
+    def configs(self) -> Mapping[str, AuthConfig]:
+        """Read-only live view of all configurations, without copying."""
+        return self._configs_view
     
     def add_config(self, service_name: str, config_dict: Dict) -> AuthConfig:
         """
@@ -69,32 +99,36 @@ class AuthConfigManager:
         Returns:
             AuthConfig: Created configuration object
         """
-        auth_type = config_dict.get('auth_type', '').lower()
-        config_classes = {
-            'basic': BasicAuthConfig,
-            'form': FormAuthConfig,
-            'token': TokenAuthConfig
-        }
-        
-        config_class = config_classes.get(auth_type)
-        if not config_class:
-            raise ValueError(f"Unsupported auth type: {auth_type}")
+        auth_type = config_dict.get('auth_type', '')
+        try:
+            config_class = _CONFIG_CLASSES[auth_type.casefold()]
+        except KeyError:
+            raise ValueError(f"Unsupported auth type: {auth_type}") from None
         
         config = config_class(**config_dict)
         self._configs[service_name] = config
+        self._names_by_lower[service_name.lower()] = service_name
         return config
     
     def get_config(self, service_name: str) -> Optional[AuthConfig]:
         """
         Get configuration for a service.
         
+        Exact names are matched first; other casings fall back to the
+        lower-case index maintained by add_config.
+        
         Args:
             service_name: Name of the service
             
         Returns:
             Optional[AuthConfig]: Configuration object if found
         """
-        return self._configs.get(service_name)
+        config = self._configs.get(service_name)
+        if config is None:
+            registered_name = self._names_by_lower.get(service_name.lower())
+            if registered_name is not None:
+                config = self._configs.get(registered_name)
+        return config
     
     def remove_config(self, service_name: str) -> None:
         """
@@ -104,11 +138,16 @@ class AuthConfigManager:
             service_name: Name of the service
         """
         self._configs.pop(service_name, None)
+        if self._names_by_lower.get(service_name.lower()) == service_name:
+            del self._names_by_lower[service_name.lower()]
     
     def list_configs(self) -> Dict[str, AuthConfig]:
         """
         List all configurations.
         
+        Prefer the ``configs`` view when the result is only read; this method
+        returns a copy on every call.
+        
         Returns:
             Dict[str, AuthConfig]: Dictionary of service names to configurations
         """
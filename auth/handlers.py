@@ -3,30 +3,119 @@ Authentication handlers for different authentication methods.
 Provides a flexible system for handling various authentication types.
 """
 import abc
+import asyncio
 import logging
 import time
-from typing import Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+from urllib.parse import urlsplit
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from .storage import CredentialManager
+from .utils import _SSL_CONTEXT
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds subtracted from a token's lifetime so it is refreshed before the server rejects it
+TOKEN_EXPIRY_MARGIN = 30.0
+
+class _SharedTLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that verifies certificates with one process-wide SSLContext.
+    
+    Without it urllib3 builds a context and reloads the CA bundle for every new
+    connection. Requests with custom verify/cert settings keep the default path.
+    """
+    
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if verify is True and cert is None:
+            pool_kwargs['ssl_context'] = _SSL_CONTEXT
+        return host_params, pool_kwargs
+
+# Connection-pooling adapters shared by every handler, keyed by scheme+host
+_ADAPTER_POOL: Dict[str, HTTPAdapter] = {}
+
+def _get_session(base_url: Optional[str] = None) -> requests.Session:
+    """
+    Create a session backed by a shared, pooled transport adapter.
+    
+    Each handler keeps its own cookies, headers and auth, while the underlying
+    TCP/TLS connections are reused across handlers talking to the same host.
+    
+    Args:
+        base_url: Base URL of the service, used to pick the adapter pool
+        
+    Returns:
+        requests.Session: Session with the shared adapter mounted
+    """
+    parts = urlsplit(base_url or '')
+    pool_key = f"{parts.scheme}://{parts.netloc}" if parts.netloc else ''
+    
+    adapter = _ADAPTER_POOL.get(pool_key)
+    if adapter is None:
+        adapter = _SharedTLSAdapter(
+            pool_connections=10,
+            pool_maxsize=100,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        _ADAPTER_POOL[pool_key] = adapter
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Handler class for each supported auth type, filled in by register_handler
+_HANDLERS: Dict[str, type] = {}
+
+def register_handler(auth_type: str):
+    """
+    Class decorator registering an AuthHandler subclass for an auth type.
+    
+    Args:
+        auth_type: Auth type name the handler serves (case-insensitive)
+        
+    Returns:
+        Decorator that registers and returns the class unchanged
+    """
+    def decorator(handler_class: type) -> type:
+        _HANDLERS[auth_type.casefold()] = handler_class
+        return handler_class
+    return decorator
+
 class AuthHandler(abc.ABC):
     """Base class for authentication handlers."""
     
-    def __init__(self, credential_manager: CredentialManager):
+    __slots__ = (
+        'credential_manager',
+        'base_url',
+        'session',
+        '_token',
+        '_token_expiry',
+        '_auth_valid_until_monotonic'
+    )
+    
+    def __init__(self, credential_manager: CredentialManager, base_url: Optional[str] = None):
         """
         Initialize the auth handler.
         
         Args:
             credential_manager: Instance of CredentialManager for credential storage
+            base_url: Optional base URL of the service, used for connection pooling
         """
         self.credential_manager = credential_manager
-        self.session = requests.Session()
+        self.base_url = base_url
+        self.session = _get_session(base_url)
         self._token = None
         self._token_expiry = None
+        # Monotonic deadline for the current token; only authenticate() writes it
+        self._auth_valid_until_monotonic: float = 0.0
     
     @abc.abstractmethod
     def authenticate(self, **kwargs) -> bool:
@@ -57,9 +146,12 @@ class AuthHandler(abc.ABC):
         self._token_expiry = None
         self.session.cookies.clear()
 
+@register_handler('basic')
 class BasicAuthHandler(AuthHandler):
     """Handler for basic authentication."""
     
+    __slots__ = ()
+    
     def authenticate(self, username: str, password: str, **kwargs) -> bool:
         """
         Authenticate using basic auth.
@@ -84,9 +176,12 @@ class BasicAuthHandler(AuthHandler):
         """Check if basic auth session is valid."""
         return self.session.auth is not None
 
+@register_handler('form')
 class FormAuthHandler(AuthHandler):
     """Handler for form-based authentication."""
     
+    __slots__ = ()
+    
     def authenticate(self, username: str, password: str, **kwargs) -> bool:
         """
         Authenticate using form submission.
@@ -108,22 +203,86 @@ class FormAuthHandler(AuthHandler):
             response = self.session.get(form_url)
             csrf_token = self._extract_csrf_token(response.text)
             
-            # Prepare form data
-            form_data = kwargs.get('form_data', {})
-            form_data.update({
-                'username': username,
-                'password': password
-            })
-            if csrf_token:
-                form_data['csrf_token'] = csrf_token
-            
             # Submit form
+            form_data = self._build_form_data(username, password, kwargs.get('form_data'), csrf_token)
             response = self.session.post(form_url, data=form_data)
             return self._verify_auth_success(response)
         except Exception as e:
             logger.error(f"Form auth failed: {e}")
             return False
     
+    async def authenticate_async(
+        self,
+        username: str,
+        password: str,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        **kwargs
+    ) -> bool:
+        """
+        Authenticate using form submission without blocking the event loop.
+        
+        Cookies obtained by the login are copied into ``self.session`` so the
+        handler can be used for regular requests afterwards.
+        
+        Args:
+            username: Username for authentication
+            password: Password for authentication
+            connector: Optional shared connector so many logins reuse connections
+            **kwargs: Additional parameters including form_url and form_data
+            
+        Returns:
+            bool: True if authentication was successful
+        """
+        try:
+            form_url = kwargs.get('form_url')
+            if not form_url:
+                raise ValueError("form_url is required")
+            
+            # A private cookie jar per login keeps sessions for the same site apart,
+            # while the connector (and its open connections) can be shared
+            async with aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=connector is None,
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            ) as client:
+                async with client.get(form_url) as response:
+                    csrf_token = self._extract_csrf_token(await response.text())
+                
+                form_data = self._build_form_data(username, password, kwargs.get('form_data'), csrf_token)
+                async with client.post(form_url, data=form_data) as response:
+                    success = response.status == 200 and 'login' not in str(response.url).lower()
+                
+                if success:
+                    host = urlsplit(form_url).hostname or ''
+                    for morsel in client.cookie_jar:
+                        self.session.cookies.set(
+                            morsel.key,
+                            morsel.value,
+                            domain=morsel['domain'] or host,
+                            path=morsel['path'] or '/'
+                        )
+                return success
+        except Exception as e:
+            logger.error(f"Form auth failed: {e}")
+            return False
+    
+    def _build_form_data(
+        self,
+        username: str,
+        password: str,
+        extra_fields: Optional[Dict[str, str]],
+        csrf_token: Optional[str]
+    ) -> Dict[str, str]:
+        """Build the login form payload without mutating the caller's form_data."""
+        form_data = dict(extra_fields or {})
+        form_data.update({
+            'username': username,
+            'password': password
+        })
+        if csrf_token:
+            form_data['csrf_token'] = csrf_token
+        return form_data
+    
     def _extract_csrf_token(self, html: str) -> Optional[str]:
         """Extract CSRF token from HTML."""
         # Implement CSRF token extraction based on the site's structure
@@ -137,9 +296,12 @@ class FormAuthHandler(AuthHandler):
         """Check if form auth session is valid."""
         return bool(self.session.cookies)
 
+@register_handler('token')
 class TokenAuthHandler(AuthHandler):
     """Handler for token-based authentication."""
     
+    __slots__ = ()
+    
     def authenticate(self, username: str, password: str, **kwargs) -> bool:
         """
         Authenticate and obtain token.
@@ -164,11 +326,16 @@ class TokenAuthHandler(AuthHandler):
             })
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = orjson.loads(response.content)
                 self._token = token_data.get('token')
                 expiry = token_data.get('expires_in')
                 if expiry:
                     self._token_expiry = time.time() + expiry
+                    self._auth_valid_until_monotonic = (
+                        time.monotonic() + max(expiry - TOKEN_EXPIRY_MARGIN, 0.0)
+                    )
+                else:
+                    self._auth_valid_until_monotonic = float('inf')
                 
                 # Add token to session headers
                 self.session.headers.update({
@@ -181,32 +348,83 @@ class TokenAuthHandler(AuthHandler):
             return False
     
     def is_authenticated(self) -> bool:
-        """Check if token is valid and not expired."""
-        if not self._token:
-            return False
-        if self._token_expiry and time.time() > self._token_expiry:
-            return False
-        return True
+        """
+        Check if token is valid and not expired.
+        
+        Uses the monotonic deadline computed in authenticate(), so the hot path is
+        a single comparison that is immune to wall-clock adjustments.
+        """
+        return bool(self._token) and time.monotonic() < self._auth_valid_until_monotonic
 
-def create_auth_handler(auth_type: str, credential_manager: CredentialManager) -> AuthHandler:
+def create_auth_handler(
+    auth_type: str,
+    credential_manager: CredentialManager,
+    base_url: Optional[str] = None
+) -> AuthHandler:
     """
     Factory function to create appropriate auth handler.
     
     Args:
         auth_type: Type of authentication ('basic', 'form', or 'token')
         credential_manager: Instance of CredentialManager
+        base_url: Optional base URL of the service (e.g. from its AuthConfig)
         
     Returns:
         AuthHandler: Instance of appropriate auth handler
     """
-    handlers = {
-        'basic': BasicAuthHandler,
-        'form': FormAuthHandler,
-        'token': TokenAuthHandler
-    }
+    try:
+        handler_class = _HANDLERS[auth_type.casefold()]
+    except KeyError:
+        raise ValueError(f"Unsupported auth type: {auth_type}") from None
+    
+    return handler_class(credential_manager, base_url=base_url)
+
+@dataclass
+class LoginSpec:
+    """A single form login to perform as part of a batch."""
+    username: str
+    password: str
+    form_url: str
+    form_data: Dict[str, str] = field(default_factory=dict)
+
+async def batch_authenticate(
+    targets: List[LoginSpec],
+    credential_manager: CredentialManager,
+    limit: int = 100
+) -> List[FormAuthHandler]:
+    """
+    Perform many form logins concurrently over a shared connection pool.
+    
+    Each login still does its CSRF GET followed by the POST, but the round
+    trips of different targets overlap instead of running back to back.
+    
+    Args:
+        targets: Logins to perform
+        credential_manager: Instance of CredentialManager
+        limit: Maximum number of simultaneous connections
+        
+    Returns:
+        List[FormAuthHandler]: One handler per target, in input order; check
+        ``is_authenticated()`` for the outcome of each login
+    """
+    handlers = [
+        FormAuthHandler(credential_manager, base_url=target.form_url)
+        for target in targets
+    ]
     
-    handler_class = handlers.get(auth_type.lower())
-    if not handler_class:
-        raise ValueError(f"Unsupported auth type: {auth_type}")
+    connector = aiohttp.TCPConnector(limit=limit)
+    try:
+        await asyncio.gather(*(
+            handler.authenticate_async(
+                target.username,
+                target.password,
+                connector=connector,
+                form_url=target.form_url,
+                form_data=target.form_data
+            )
+            for handler, target in zip(handlers, targets)
+        ))
+    finally:
+        await connector.close()
     
-    return handler_class(credential_manager)
+    return handlers
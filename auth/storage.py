@@ -5,7 +5,9 @@ Implements a layered approach to credential storage with fallback mechanisms.
 import os
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
 import keyring
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
@@ -13,18 +15,33 @@ from dotenv import load_dotenv
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Load environment variables from .env file once per process rather than per manager
+load_dotenv()
+
+# Seconds a retrieved credential is served from memory before re-reading the backend
+CREDENTIAL_CACHE_TTL = 300.0
+
 class CredentialManager:
     """Manages secure storage and retrieval of credentials."""
     
-    def __init__(self, service_name: str = "insurance_scraper"):
+    def __init__(self, service_name: str = "insurance_scraper", cache_ttl: float = CREDENTIAL_CACHE_TTL):
         """
         Initialize the credential manager.
         
         Args:
             service_name: The name of the service for keyring storage
+            cache_ttl: Seconds to keep retrieved credentials in memory (0 disables caching)
         """
         self.service_name = service_name
-        load_dotenv()  # Load environment variables from .env file
+        self._env_prefix = f"{service_name}_".upper()
+        # Backend ('keyring' or 'environment') that last stored each key in this process
+        self._backend: Dict[str, str] = {}
+        self.cache_ttl = cache_ttl
+        self._cred_cache: Dict[Tuple[str, bool], Tuple[str, float]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Index of this service's environment variables, scanned once then kept up to date
+        self._known_env_keys = {key for key in os.environ if key.startswith(self._env_prefix)}
         
         # Initialize encryption for file-based storage
         self._init_encryption()
@@ -52,9 +69,12 @@ class CredentialManager:
         Returns:
             bool: True if storage was successful
         """
+        self._invalidate_cached(key)
+        
         try:
             if use_keyring:
                 keyring.set_password(self.service_name, key, value)
+                self._backend[key] = 'keyring'
                 logger.info(f"Stored credential {key} in keyring")
                 return True
         except Exception as e:
@@ -63,7 +83,10 @@ class CredentialManager:
         # Fallback to encrypted file storage
         try:
             encrypted_value = self.cipher_suite.encrypt(value.encode())
-            os.environ[f"{self.service_name.upper()}_{key.upper()}"] = encrypted_value.decode()
+            env_key = self._env_key(key)
+            os.environ[env_key] = encrypted_value.decode()
+            self._known_env_keys.add(env_key)
+            self._backend[key] = 'environment'
             logger.info(f"Stored encrypted credential {key} in environment")
             return True
         except Exception as e:
@@ -81,7 +104,26 @@ class CredentialManager:
         Returns:
             Optional[str]: The credential value if found, None otherwise
         """
-        if use_keyring:
+        cache_key = (key, use_keyring)
+        cached = self._cred_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[1] < self.cache_ttl:
+            return cached[0]
+        
+        # Only misses take the lock, so concurrent lookups of one key hit the backend once
+        with self._cache_lock:
+            cached = self._cred_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[1] < self.cache_ttl:
+                return cached[0]
+            
+            value = self._fetch_credential(key, use_keyring)
+            if value is not None and self.cache_ttl > 0:
+                self._cred_cache[cache_key] = (value, time.monotonic())
+            return value
+    
+    def _fetch_credential(self, key: str, use_keyring: bool) -> Optional[str]:
+        """Read a credential from keyring or the encrypted environment, bypassing the cache."""
+        # Skip the keyring round trip when this manager knows the secret lives in the environment
+        if use_keyring and self._backend.get(key) != 'environment':
             try:
                 value = keyring.get_password(self.service_name, key)
                 if value:
@@ -90,8 +132,7 @@ class CredentialManager:
                 logger.warning(f"Failed to retrieve from keyring: {e}")
         
         # Try environment variable
-        env_key = f"{self.service_name.upper()}_{key.upper()}"
-        encrypted_value = os.getenv(env_key)
+        encrypted_value = os.getenv(self._env_key(key))
         if encrypted_value:
             try:
                 decrypted_value = self.cipher_suite.decrypt(encrypted_value.encode())
@@ -112,6 +153,8 @@ class CredentialManager:
         Returns:
             bool: True if deletion was successful
         """
+        self._invalidate_cached(key)
+        self._backend.pop(key, None)
         success = False
         
         if use_keyring:
@@ -123,7 +166,8 @@ class CredentialManager:
                 logger.warning(f"Failed to delete from keyring: {e}")
         
         # Also remove from environment if present
-        env_key = f"{self.service_name.upper()}_{key.upper()}"
+        env_key = self._env_key(key)
+        self._known_env_keys.discard(env_key)
         if env_key in os.environ:
             del os.environ[env_key]
             success = True
@@ -131,6 +175,16 @@ class CredentialManager:
         
         return success
     
+    def _env_key(self, key: str) -> str:
+        """Name of the environment variable holding the encrypted credential."""
+        return self._env_prefix + key.upper()
+    
+    def _invalidate_cached(self, key: str) -> None:
+        """Drop any cached values for a credential."""
+        with self._cache_lock:
+            self._cred_cache.pop((key, True), None)
+            self._cred_cache.pop((key, False), None)
+    
     def list_credentials(self) -> Dict[str, Any]:
         """
         List all stored credentials (keys only, not values).
@@ -141,10 +195,10 @@ class CredentialManager:
         credentials = {}
         
         # List environment variables for this service
-        prefix = f"{self.service_name.upper()}_"
-        for key in os.environ:
-            if key.startswith(prefix):
-                clean_key = key[len(prefix):].lower()
+        prefix_len = len(self._env_prefix)
+        for key in self._known_env_keys:
+            if key in os.environ:
+                clean_key = key[prefix_len:].lower()
                 credentials[clean_key] = {"storage": "environment"}
         
         # Note: Keyring doesn't provide a native way to list all credentials
@@ -1,15 +1,39 @@
 """
 Utility functions for authentication handling.
 """
+import functools
 import logging
 import re
+import socket
+import ssl
 from typing import Optional, Dict, Any
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+import orjson
 import requests
-from requests.exceptions import RequestException
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing an absent key from one whose value is None
+_MISSING = object()
+
+# Compiled once; the root itself may be the form when parsing a fragment
+_FORM_XPATH = etree.XPath('descendant-or-self::form[1]')
+_FORM_BY_ID_XPATH = etree.XPath('descendant-or-self::form[@id=$form_id][1]')
+_FORM_FIELDS_XPATH = etree.XPath('.//input[@name] | .//select[@name]')
+
+# Loading the CA bundle is costly, so one verifying context serves every probe
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Key fragments whose values must never be logged or persisted
+_SENSITIVE_RE = re.compile(r'password|token|api_key|secret|private_key', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=32)
+def _token_regex(token_name: str) -> re.Pattern:
+    """Return a cached case-insensitive pattern matching the given token field name."""
+    return re.compile(re.escape(token_name), re.I)
+
 def extract_csrf_token(html: str, token_name: str = "csrf_token") -> Optional[str]:
     """
     Extract CSRF token from HTML content.
@@ -22,15 +46,16 @@ def extract_csrf_token(html: str, token_name: str = "csrf_token") -> Optional[st
         Optional[str]: CSRF token if found
     """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
+        token_regex = _token_regex(token_name)
         
         # Check meta tags
-        meta_tag = soup.find('meta', {'name': re.compile(f'{token_name}', re.I)})
+        meta_tag = soup.find('meta', {'name': token_regex})
         if meta_tag and meta_tag.get('content'):
             return meta_tag['content']
         
         # Check input fields
-        input_tag = soup.find('input', {'name': re.compile(f'{token_name}', re.I)})
+        input_tag = soup.find('input', {'name': token_regex})
         if input_tag and input_tag.get('value'):
             return input_tag['value']
         
@@ -39,20 +64,34 @@ def extract_csrf_token(html: str, token_name: str = "csrf_token") -> Optional[st
         logger.error(f"Failed to extract CSRF token: {e}")
         return None
 
-def verify_ssl_cert(url: str) -> bool:
+def verify_ssl_cert(url: str, timeout: float = 5.0) -> bool:
     """
     Verify SSL certificate of a URL.
     
+    Only the TLS handshake is performed; no HTTP request is sent. Plain
+    http:// URLs have no certificate to check and are not connected to.
+    
     Args:
         url: URL to verify
+        timeout: Connection timeout in seconds
         
     Returns:
-        bool: True if certificate is valid
+        bool: True if certificate is valid, or the URL is plain HTTP
     """
     try:
-        response = requests.get(url, verify=True)
-        return True
-    except RequestException:
+        parts = urlsplit(url)
+        host = parts.hostname
+        if not host:
+            return False
+        if parts.scheme == 'http':
+            return True
+        if parts.scheme != 'https':
+            return False
+        
+        with socket.create_connection((host, parts.port or 443), timeout=timeout) as sock:
+            with _SSL_CONTEXT.wrap_socket(sock, server_hostname=host):
+                return True
+    except (OSError, ValueError):
         return False
 
 def extract_form_fields(html: str, form_id: Optional[str] = None) -> Dict[str, str]:
@@ -67,17 +106,15 @@ def extract_form_fields(html: str, form_id: Optional[str] = None) -> Dict[str, s
         Dict[str, str]: Dictionary of field names and default values
     """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        form = soup.find('form', {'id': form_id}) if form_id else soup.find('form')
+        tree = lxml_html.fromstring(html)
+        forms = _FORM_BY_ID_XPATH(tree, form_id=form_id) if form_id else _FORM_XPATH(tree)
         
-        if not form:
+        if not forms:
             return {}
         
         fields = {}
-        for input_tag in form.find_all(['input', 'select']):
-            name = input_tag.get('name')
-            if name:
-                fields[name] = input_tag.get('value', '')
+        for element in _FORM_FIELDS_XPATH(forms[0]):
+            fields[element.get('name')] = element.get('value', '')
         
         return fields
     except Exception as e:
@@ -96,7 +133,7 @@ def parse_token_response(response: requests.Response, token_field: str = "token"
         Dict[str, Any]: Dictionary containing token and related data
     """
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
         result = {
             'token': data.get(token_field),
             'expires_in': data.get('expires_in'),
@@ -120,21 +157,20 @@ def validate_auth_response(response: requests.Response, success_indicators: Dict
         bool: True if response matches success indicators
     """
     try:
-        # Check status code
+        # Checks run cheapest first so a mismatch exits before any body parsing
         if 'status_code' in success_indicators:
             if response.status_code != success_indicators['status_code']:
                 return False
         
+        # Check cookies
+        cookies = success_indicators.get('cookies')
+        if cookies and not set(cookies).issubset(response.cookies.keys()):
+            return False
+        
         # Check headers
         headers = success_indicators.get('headers', {})
         for header, value in headers.items():
-            if header not in response.headers or response.headers[header] != value:
-                return False
-        
-        # Check cookies
-        cookies = success_indicators.get('cookies', [])
-        for cookie in cookies:
-            if cookie not in response.cookies:
+            if response.headers.get(header, _MISSING) != value:
                 return False
         
         # Check content
@@ -145,7 +181,7 @@ def validate_auth_response(response: requests.Response, success_indicators: Dict
             elif isinstance(content, dict):
                 response_json = response.json()
                 for key, value in content.items():
-                    if key not in response_json or response_json[key] != value:
+                    if response_json.get(key, _MISSING) != value:
                         return False
         
         return True
@@ -163,8 +199,7 @@ def sanitize_auth_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Sanitized data dictionary
     """
-    sensitive_fields = {'password', 'token', 'api_key', 'secret', 'private_key'}
     return {
-        k: '***' if any(field in k.lower() for field in sensitive_fields) else v
+        k: '***' if _SENSITIVE_RE.search(k) else v
         for k, v in data.items()
     }
@@ -1,8 +1,12 @@
 """Convert sample text file to PDF."""
 
+import re
 from pathlib import Path
 from fpdf import FPDF
 
+# Section labels rendered in bold
+BOLD_MARKERS = re.compile(r'CDT Code:|Description:|Requirements:')
+
 class PDF(FPDF):
     def __init__(self):
         super().__init__()
@@ -22,29 +26,28 @@ def create_pdf():
     pdf.set_font("Helvetica", size=11)
     
     # Add content
-    with open(text_path, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if not line:  # Handle empty lines
-                pdf.ln(5)
-                continue
-                
-            if line.startswith('•'):
-                # Replace bullet points with dashes
-                line = '- ' + line[1:].strip()
-                pdf.set_x(30)  # Indent bullet points
+    for line in text_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line:  # Handle empty lines
+            pdf.ln(5)
+            continue
+            
+        if line.startswith('•'):
+            # Replace bullet points with dashes
+            line = '- ' + line[1:].strip()
+            pdf.set_x(30)  # Indent bullet points
+            pdf.multi_cell(0, 8, line)
+        else:
+            pdf.set_x(20)  # Reset to left margin
+            # Make title text bold
+            if BOLD_MARKERS.search(line):
+                pdf.set_font("Helvetica", 'B', 11)
                 pdf.multi_cell(0, 8, line)
+                pdf.set_font("Helvetica", size=11)
             else:
-                pdf.set_x(20)  # Reset to left margin
-                # Make title text bold
-                if "CDT Code:" in line or "Description:" in line or "Requirements:" in line:
-                    pdf.set_font("Helvetica", 'B', 11)
-                    pdf.multi_cell(0, 8, line)
-                    pdf.set_font("Helvetica", size=11)
-                else:
-                    pdf.multi_cell(0, 8, line)
-            
-            pdf.ln(2)  # Add small space between lines
+                pdf.multi_cell(0, 8, line)
+        
+        pdf.ln(2)  # Add small space between lines
     
     # Save the PDF
     output_path = Path("sample_dental_guidelines.pdf")
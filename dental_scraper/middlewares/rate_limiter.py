@@ -1,16 +1,26 @@
 """
 Rate limiting middleware for the dental insurance guidelines web scraper.
 """
-from typing import Optional
 import time
-from collections import defaultdict
 
 from scrapy import Spider, Request
 from scrapy.exceptions import IgnoreRequest
+from scrapy.utils.defer import maybe_deferred_to_future
+from scrapy.utils.httpobj import urlparse_cached
+from twisted.internet.task import deferLater
 from loguru import logger
 
 from ..exceptions import RateLimitException
 
+class _DomainState:
+    """Rate limiting state for one domain: last request time and delay."""
+    
+    __slots__ = ('last', 'delay')
+    
+    def __init__(self, delay: float):
+        self.last = 0.0
+        self.delay = delay
+
 class RateLimitMiddleware:
     """
     Middleware to enforce rate limiting per domain.
@@ -21,42 +31,56 @@ class RateLimitMiddleware:
     
     def __init__(self):
         """Initialize the rate limiter."""
-        # Track last request time per domain
-        self.last_request_time = defaultdict(float)
         # Default delay between requests (in seconds)
         self.default_delay = 2.0
-        # Custom delays per domain
-        self.domain_delays = {}
+        # Last request time and delay per domain, found with one lookup
+        self._state = {}
+    
+    def _domain_state(self, domain: str) -> _DomainState:
+        """Return the state for a domain, creating it with the default delay."""
+        state = self._state.get(domain)
+        if state is None:
+            state = self._state[domain] = _DomainState(self.default_delay)
+        return state
+    
+    def _domain(self, request: Request) -> str:
+        """Return the request's domain, parsing the URL only once per request."""
+        # Cached per request object, so redirects and replace(url=...) are parsed afresh
+        return urlparse_cached(request).netloc
         
-    def process_request(self, request: Request, spider: Spider) -> Optional[Request]:
+    async def process_request(self, request: Request, spider: Spider) -> None:
         """
         Process each request and enforce rate limiting.
         
+        When the domain was hit too recently, the remaining delay is awaited;
+        Scrapy holds the request meanwhile while the reactor keeps serving
+        other domains.
+        
         Args:
             request: The request being processed
             spider: The spider making the request
             
         Returns:
-            None if request should proceed, raises IgnoreRequest if rate limit exceeded
-            
-        Raises:
-            IgnoreRequest: If rate limit is exceeded
+            None once the request may proceed
         """
-        domain = request.url.split('/')[2]
+        domain = self._domain(request)
         current_time = time.time()
-        
-        # Get delay for this domain (use default if not specified)
-        delay = self.domain_delays.get(domain, self.default_delay)
+        state = self._domain_state(domain)
         
         # Check if enough time has passed since last request
-        time_since_last = current_time - self.last_request_time[domain]
-        if time_since_last < delay:
-            wait_time = delay - time_since_last
+        time_since_last = current_time - state.last
+        if time_since_last < state.delay:
+            wait_time = state.delay - time_since_last
             logger.warning(f"Rate limit reached for {domain}. Waiting {wait_time:.2f} seconds")
-            time.sleep(wait_time)
+            # Reserve the slot now so requests queued meanwhile line up behind this one
+            state.last = current_time + wait_time
+            # Imported lazily so the reactor Scrapy configures is the one installed
+            from twisted.internet import reactor
+            await maybe_deferred_to_future(deferLater(reactor, wait_time))
+            return None
         
         # Update last request time
-        self.last_request_time[domain] = time.time()
+        state.last = current_time
         
         return None
         
@@ -77,12 +101,12 @@ class RateLimitMiddleware:
         """
         # Check for rate limit response codes
         if response.status in [429, 503]:
-            domain = request.url.split('/')[2]
+            domain = self._domain(request)
             
             # Increase delay for this domain
-            current_delay = self.domain_delays.get(domain, self.default_delay)
-            new_delay = current_delay * 2
-            self.domain_delays[domain] = new_delay
+            state = self._domain_state(domain)
+            state.delay *= 2
+            new_delay = state.delay
             
             logger.warning(f"Rate limit response from {domain}. Increasing delay to {new_delay} seconds")
             raise RateLimitException(f"Rate limit exceeded for {domain}")
@@ -97,5 +121,5 @@ class RateLimitMiddleware:
             domain: The domain to set delay for
             delay: Delay in seconds between requests
         """
-        self.domain_delays[domain] = delay
+        self._domain_state(domain).delay = delay
         logger.info(f"Set rate limit delay for {domain} to {delay} seconds") 
\ No newline at end of file
@@ -4,6 +4,7 @@ Data models for the dental insurance guidelines web scraper.
 
 from .procedure import Procedure
 from .carrier import CarrierGuidelines
+from .fast import ProcedureFast, CarrierFast
 from .validation import DataValidator
 
-__all__ = ['Procedure', 'CarrierGuidelines', 'DataValidator'] 
\ No newline at end of file
+__all__ = ['Procedure', 'CarrierGuidelines', 'ProcedureFast', 'CarrierFast', 'DataValidator'] 
\ No newline at end of file
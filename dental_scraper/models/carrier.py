@@ -3,7 +3,7 @@ Models for insurance carrier guidelines.
 """
 from typing import Dict, List, Optional
 from datetime import date
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from .procedure import Procedure
 
@@ -24,37 +24,35 @@ class CarrierGuidelines(BaseModel):
     procedures: List[Procedure] = Field(
         ...,
         description="List of procedures and their requirements",
-        min_items=1
+        min_length=1
     )
     metadata: Dict = Field(
         default_factory=dict,
         description="Additional carrier-specific metadata"
     )
     
-    class Config:
-        """Pydantic model configuration."""
-        json_schema_extra = {
-            "example": {
-                "carrier": "Aetna",
-                "year": 2024,
-                "source_url": "https://www.aetna.com/dental/guidelines-2024.pdf",
-                "last_updated": "2024-01-01",
-                "procedures": [
-                    {
-                        "code": "D0150",
-                        "description": "Comprehensive oral evaluation",
-                        "requirements": [
-                            "Complete charting",
-                            "Medical history"
-                        ],
-                        "notes": "Once per provider",
-                        "effective_date": "2024-01-01"
-                    }
-                ],
-                "metadata": {
-                    "version": "2024.1",
-                    "region": "National",
-                    "plan_types": ["PPO", "DMO"]
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "carrier": "Aetna",
+            "year": 2024,
+            "source_url": "https://www.aetna.com/dental/guidelines-2024.pdf",
+            "last_updated": "2024-01-01",
+            "procedures": [
+                {
+                    "code": "D0150",
+                    "description": "Comprehensive oral evaluation",
+                    "requirements": [
+                        "Complete charting",
+                        "Medical history"
+                    ],
+                    "notes": "Once per provider",
+                    "effective_date": "2024-01-01"
                 }
+            ],
+            "metadata": {
+                "version": "2024.1",
+                "region": "National",
+                "plan_types": ["PPO", "DMO"]
             }
-        } 
\ No newline at end of file
+        }
+    })
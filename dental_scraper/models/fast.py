@@ -0,0 +1,42 @@
+"""
+Lightweight msgspec mirrors of the guideline models.
+
+These structs are used to bulk-load previously cached guideline JSON for
+in-memory filtering and analytics. Decoding into them validates types and
+simple constraints in C, which is much faster than building Pydantic
+models. Convert to CarrierGuidelines with to_model() at API boundaries
+where full validation is needed.
+"""
+from typing import Annotated, Any, Dict, List, Optional
+from datetime import date
+
+import msgspec
+
+from .carrier import CarrierGuidelines
+
+
+class ProcedureFast(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of Procedure for the bulk-load path."""
+    code: Annotated[str, msgspec.Meta(pattern=r'^D\d{4}$')]
+    description: str
+    requirements: Annotated[List[str], msgspec.Meta(min_length=1)]
+    effective_date: date
+    notes: Optional[str] = None
+
+
+class CarrierFast(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of CarrierGuidelines for the bulk-load path."""
+    carrier: str
+    year: Annotated[int, msgspec.Meta(ge=2024, le=2026)]
+    source_url: str
+    last_updated: date
+    procedures: Annotated[List[ProcedureFast], msgspec.Meta(min_length=1)]
+    metadata: Dict[str, Any] = {}
+    
+    def to_model(self) -> CarrierGuidelines:
+        """Convert to a fully validated CarrierGuidelines model."""
+        return CarrierGuidelines.model_validate(msgspec.to_builtins(self))
+
+
+# Decoder is built once; msgspec compiles the schema on construction
+CARRIERS_DECODER = msgspec.json.Decoder(List[CarrierFast])
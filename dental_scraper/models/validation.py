@@ -4,12 +4,23 @@ Validation utilities for insurance guidelines data.
 from typing import Dict, List, Optional, Tuple
 from datetime import date
 
-from pydantic import ValidationError
+import msgspec
+from pydantic import TypeAdapter, ValidationError
 from loguru import logger
 
 from .carrier import CarrierGuidelines
+from .fast import CARRIERS_DECODER, CarrierFast
 from .procedure import Procedure
 
+# Validators are built once at import instead of being resolved on every call
+_CARRIER_ADAPTER = TypeAdapter(CarrierGuidelines)
+_PROCEDURE_ADAPTER = TypeAdapter(Procedure)
+_PROCEDURE_LIST_ADAPTER = TypeAdapter(List[Procedure])
+
+# Accepted range for guideline dates (inclusive)
+_MIN_DATE = date(2024, 1, 1)
+_MAX_DATE = date(2026, 12, 31)
+
 
 class DataValidator:
     """
@@ -31,7 +42,7 @@ class DataValidator:
             - List of validation error messages if any
         """
         try:
-            validated_data = CarrierGuidelines(**data)
+            validated_data = _CARRIER_ADAPTER.validate_python(data)
             return True, validated_data, []
         except ValidationError as e:
             errors = [f"{error['loc']}: {error['msg']}" for error in e.errors()]
@@ -53,13 +64,99 @@ class DataValidator:
             - List of validation error messages if any
         """
         try:
-            validated_data = Procedure(**data)
+            validated_data = _PROCEDURE_ADAPTER.validate_python(data)
             return True, validated_data, []
         except ValidationError as e:
             errors = [f"{error['loc']}: {error['msg']}" for error in e.errors()]
             logger.error(f"Validation failed: {errors}")
             return False, None, errors
     
+    @staticmethod
+    def validate_procedures_batch(procedures: List[Dict]) -> List[Tuple[bool, Optional[Procedure], List[str]]]:
+        """
+        Validate many procedures against the Procedure model in one call.
+        
+        Args:
+            procedures: List of dictionaries containing procedure data
+            
+        Returns:
+            One (is_valid, procedure, errors) tuple per input, in input order,
+            as returned by validate_procedure_data
+        """
+        try:
+            validated = _PROCEDURE_LIST_ADAPTER.validate_python(procedures)
+            return [(True, procedure, []) for procedure in validated]
+        except ValidationError as e:
+            # Errors are keyed by list index; the passing items are rebuilt in a second batch
+            failed = {}
+            for error in e.errors():
+                index, *loc = error['loc']
+                failed.setdefault(index, []).append(f"{tuple(loc)}: {error['msg']}")
+        
+        passed = [data for index, data in enumerate(procedures) if index not in failed]
+        validated = iter(_PROCEDURE_LIST_ADAPTER.validate_python(passed))
+        results = []
+        for index in range(len(procedures)):
+            if index in failed:
+                logger.error(f"Validation failed: {failed[index]}")
+                results.append((False, None, failed[index]))
+            else:
+                results.append((True, next(validated), []))
+        return results
+    
+    @staticmethod
+    def validate_carrier_data_trusted(data: Dict) -> CarrierGuidelines:
+        """
+        Build a CarrierGuidelines instance from trusted data without validation.
+        
+        Only for data this package produced and already validated (e.g. records
+        reloaded from our own cache). Nested procedures must already be
+        Procedure instances, since model_construct does not convert dicts.
+        Use validate_carrier_data for anything scraped from the web.
+        
+        Args:
+            data: Dictionary containing carrier guidelines data
+            
+        Returns:
+            CarrierGuidelines instance
+        """
+        return CarrierGuidelines.model_construct(**data)
+    
+    @staticmethod
+    def validate_procedure_data_trusted(data: Dict) -> Procedure:
+        """
+        Build a Procedure instance from trusted data without validation.
+        
+        Only for data this package produced and already validated. Use
+        validate_procedure_data for anything scraped from the web.
+        
+        Args:
+            data: Dictionary containing procedure data
+            
+        Returns:
+            Procedure instance
+        """
+        return Procedure.model_construct(**data)
+    
+    @staticmethod
+    def load_carriers_fast(json_bytes: bytes) -> List[CarrierFast]:
+        """
+        Decode a JSON array of cached carrier guidelines into CarrierFast structs.
+        
+        Args:
+            json_bytes: Raw JSON document
+            
+        Returns:
+            List of CarrierFast structs
+            
+        Raises:
+            ValueError: If the document does not match the schema
+        """
+        try:
+            return CARRIERS_DECODER.decode(json_bytes)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid carrier guidelines data: {e}")
+    
     @staticmethod
     def validate_requirements_format(requirements: List[str]) -> List[str]:
         """
@@ -71,17 +168,14 @@ class DataValidator:
         Returns:
             List of formatted requirement strings
         """
-        formatted = []
-        for req in requirements:
-            # Remove extra whitespace
-            req = " ".join(req.split())
-            # Ensure first letter is capitalized
-            req = req[0].upper() + req[1:] if req else req
-            # Ensure ends with period
-            if req and not req.endswith('.'):
-                req += '.'
-            formatted.append(req)
-        return formatted
+        # str.split()/join collapses whitespace in C and beat both re.sub and
+        # str.translate pipelines on batches of requirement strings
+        cleaned = [" ".join(req.split()) for req in requirements]
+        # Capitalize the first letter and ensure a trailing period
+        return [
+            req[0].upper() + req[1:] + ('' if req.endswith('.') else '.') if req else req
+            for req in cleaned
+        ]
     
     @staticmethod
     def validate_date_range(date_value: date) -> bool:
@@ -94,6 +188,4 @@ class DataValidator:
         Returns:
             Boolean indicating if date is valid
         """
-        min_date = date(2024, 1, 1)
-        max_date = date(2026, 12, 31)
-        return min_date <= date_value <= max_date 
\ No newline at end of file
+        return _MIN_DATE <= date_value <= _MAX_DATE 
\ No newline at end of file
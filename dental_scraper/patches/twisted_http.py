@@ -4,19 +4,57 @@ Uses standard library modules instead of deprecated cgi module.
 """
 
 import email.parser
+import email.utils
+import functools
+import re
 import urllib.parse
 import html
 from io import BytesIO
 from email.message import Message
 
+# Token characters allowed in a media type or parameter name (RFC 2045)
+_TOKEN = r"[A-Za-z0-9!#$%&'^_`{|}~.+-]+"
+# Common "type/subtype; name=value; name=\"quoted\"" shape handled without Message
+_CONTENT_TYPE_RE = re.compile(
+    rf'\s*({_TOKEN}/{_TOKEN})\s*'
+    rf'((?:;\s*{_TOKEN}\s*=\s*(?:"(?:[^"\\]|\\.)*"|[^;"\s]*)\s*)*)'
+)
+_PARAM_RE = re.compile(rf';\s*({_TOKEN})\s*=\s*("(?:[^"\\]|\\.)*"|[^;"\s]*)')
+
 def parse_header(line):
-    """Parse a Content-type like header using email.message.Message."""
+    """
+    Parse a Content-type like header into its type and parameters.
+    
+    Common "type/subtype; name=value" headers are split with regular
+    expressions; anything else falls back to email.message.Message.
+    Results are memoized per header line.
+    """
     if not line:
         return '', {}
-        
+    
+    ctype, params = _parse_header_cached(line)
+    # Callers may mutate the dict, so each call gets its own copy
+    return ctype, dict(params)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_header_cached(line):
+    """Parse a header into (content type, parameter items), memoized per line."""
     if isinstance(line, bytes):
         line = line.decode('utf-8')
-        
+    
+    match = _CONTENT_TYPE_RE.fullmatch(line)
+    if match is None:
+        ctype, params = _parse_header_slow(line)
+        return ctype, tuple(params.items())
+    
+    main, rest = match.groups()
+    params = {main: ''}
+    for name, value in _PARAM_RE.findall(rest):
+        params[name.lower()] = email.utils.unquote(value) if value.startswith('"') else value
+    return main.lower(), tuple(params.items())
+
+def _parse_header_slow(line):
+    """Parse any header value with email.message.Message."""
     msg = Message()
     msg['content-type'] = line
     
@@ -1,49 +1,110 @@
 """
 PDF text extraction utilities for the dental insurance guidelines web scraper.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
-import json
 from datetime import datetime
 import os
 import asyncio
 from concurrent.futures import ProcessPoolExecutor
 import functools
-import hashlib
+import gzip
+import io
+import sys
+from itertools import islice
 
-import pdfplumber
+import orjson
+import pymupdf
+# pdfplumber is imported inside the methods that use it: pulling in pdfminer.six
+# is slow, and the default pymupdf text path never needs it
 from loguru import logger
 
 from ..exceptions import ParsingException
+from ..utils.cache import file_content_hash
+
+# Backends available for text extraction; tables always use pdfplumber
+TEXT_BACKENDS = ("pymupdf", "pdfplumber")
+
+# Upper bound on pages per worker task when chunk_size is derived from the worker count
+MAX_CHUNK_SIZE = 25
+
+# Cache file extension per operation; text is gzip-compressed, tables are stored as orjson
+CACHE_SUFFIXES = {"text": ".txt.gz", "tables": ".orjson"}
+
+# gzip level for the text cache; level 1 is close to copy speed and still shrinks text several-fold
+TEXT_CACHE_COMPRESSLEVEL = 1
 
 class PDFExtractor:
     """
     Utility class for extracting content from dental insurance guideline PDFs.
     """
     
-    def __init__(self, chunk_size: int = 5, cache_dir: Optional[str] = None):
+    def __init__(self, chunk_size: Optional[int] = None, cache_dir: Optional[str] = None, backend: str = "pymupdf",
+                 max_workers: Optional[int] = None, max_chunk_size: int = MAX_CHUNK_SIZE):
         """
         Initialize the PDF extractor.
         
         Args:
-            chunk_size: Number of pages to process at once
+            chunk_size: Number of pages to process at once. If None, it is sized from the page and worker counts.
             cache_dir: Directory to store cache files. If None, caching is disabled.
+            backend: Text extraction backend, "pymupdf" (MuPDF, fast) or "pdfplumber"
+            max_workers: Worker processes for chunked extraction. Defaults to the CPU count, at most 8.
+            max_chunk_size: Largest derived chunk size; ignored when chunk_size is given
         """
+        if backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}. Expected one of {TEXT_BACKENDS}")
+        
         logger.info("Initializing PDFExtractor")
         self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
         self.cache_dir = cache_dir
+        self.backend = backend
+        self.max_workers = max_workers or min(os.cpu_count() or 1, 8)
+        # Started on first use and reused by every later call
+        self._executor: Optional[ProcessPoolExecutor] = None
         
         if self.cache_dir:
             os.makedirs(self.cache_dir, exist_ok=True)
             logger.info(f"Using cache directory: {self.cache_dir}")
     
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers receive bound methods; the pool itself cannot be pickled
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    async def __aenter__(self) -> "PDFExtractor":
+        """Return the extractor for use in an async with block."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Shut down the worker pool when the async with block exits."""
+        self.close()
+    
     def _get_cache_path(self, pdf_path: Path, operation: str) -> Optional[Path]:
         """Generate a cache file path for a PDF."""
         if not self.cache_dir:
             return None
             
-        pdf_hash = hashlib.md5(str(pdf_path).encode()).hexdigest()
-        return Path(self.cache_dir) / f"{pdf_hash}_{operation}.json"
+        # Keyed on content, so renamed copies hit and overwritten files miss
+        try:
+            pdf_hash = file_content_hash(pdf_path)
+        except OSError:
+            # Unreadable files are not cached; extraction reports the error
+            return None
+        return Path(self.cache_dir) / f"{pdf_hash}_{operation}{CACHE_SUFFIXES[operation]}"
     
     async def extract_text(self, pdf_path: Path) -> str:
         """
@@ -58,63 +119,154 @@ class PDFExtractor:
         Raises:
             ParsingException: If text extraction fails
         """
-        # Check cache first
-        cache_path = self._get_cache_path(pdf_path, "text")
-        if cache_path and cache_path.exists():
-            logger.info(f"Using cached text for {pdf_path}")
-            try:
-                with open(cache_path, 'r') as f:
-                    return f.read()
-            except Exception as e:
-                logger.warning(f"Failed to read cache: {e}")
+        # Check cache first; the key hashes the whole file, so it is computed off the loop
+        cache_path = await asyncio.to_thread(self._get_cache_path, pdf_path, "text")
+        cached = self._read_text_cache(pdf_path, cache_path)
+        if cached is not None:
+            return cached
         
         try:
             text_content = []
             
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                chunks = [range(i, min(i + self.chunk_size, total_pages)) 
-                         for i in range(0, total_pages, self.chunk_size)]
+            if self.backend == "pymupdf":
+                loop = asyncio.get_event_loop()
+                text_content = await loop.run_in_executor(None, self._extract_text_pymupdf, pdf_path)
+            else:
+                # Opening the document blocks, so even the page count is read off the loop
+                loop = asyncio.get_event_loop()
+                total_pages = await loop.run_in_executor(None, self._page_count, pdf_path)
+                chunks = self._page_chunks(total_pages)
                 
                 # Process chunks in parallel
-                loop = asyncio.get_event_loop()
-                with ProcessPoolExecutor() as executor:
-                    tasks = []
-                    for chunk in chunks:
-                        task = loop.run_in_executor(
-                            executor,
-                            self._process_page_chunk,
-                            pdf_path,
-                            chunk
-                        )
-                        tasks.append(task)
-                    
-                    chunk_results = await asyncio.gather(*tasks)
-                    for result in chunk_results:
-                        text_content.extend(result)
+                executor = self._get_executor()
+                tasks = []
+                for chunk in chunks:
+                    task = loop.run_in_executor(
+                        executor,
+                        self._process_page_chunk,
+                        pdf_path,
+                        chunk
+                    )
+                    tasks.append(task)
+                
+                chunk_results = await asyncio.gather(*tasks)
+                for result in chunk_results:
+                    text_content.extend(result)
             
             full_text = '\n'.join(text_content)
             
             # Save to cache
-            if cache_path:
-                try:
-                    with open(cache_path, 'w') as f:
-                        f.write(full_text)
-                except Exception as e:
-                    logger.warning(f"Failed to write cache: {e}")
+            self._write_text_cache(cache_path, full_text)
             
             return full_text
         except Exception as e:
             raise ParsingException(f"Failed to extract text from {pdf_path}: {e}")
     
+    async def extract_text_batch(self, pdf_paths: List[Path]) -> List[str]:
+        """
+        Extract text from many PDF files concurrently.
+        
+        Each file is read and parsed in a worker thread so disk reads overlap
+        with parsing of other files.
+        
+        Args:
+            pdf_paths: Paths to the PDF files
+            
+        Returns:
+            Extracted text content, in the same order as pdf_paths
+            
+        Raises:
+            ParsingException: If text extraction fails for any file
+        """
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self._extract_text_sync, pdf_path) for pdf_path in pdf_paths)
+        ))
+    
+    def _extract_text_sync(self, pdf_path: Path) -> str:
+        """Extract the text of one PDF in the calling thread, using the cache."""
+        cache_path = self._get_cache_path(pdf_path, "text")
+        cached = self._read_text_cache(pdf_path, cache_path)
+        if cached is not None:
+            return cached
+        
+        try:
+            if self.backend == "pymupdf":
+                text_content = self._extract_text_pymupdf(pdf_path)
+            else:
+                import pdfplumber
+                
+                text_content = []
+                with pdfplumber.open(pdf_path) as pdf:
+                    for page in pdf.pages:
+                        text = self._page_text(page)
+                        # Release the page's parsed objects before loading the next one
+                        page.close()
+                        if text:
+                            text_content.append(text)
+        except Exception as e:
+            raise ParsingException(f"Failed to extract text from {pdf_path}: {e}")
+        
+        full_text = '\n'.join(text_content)
+        self._write_text_cache(cache_path, full_text)
+        return full_text
+    
+    def _read_text_cache(self, pdf_path: Path, cache_path: Optional[Path]) -> Optional[str]:
+        """Return cached text for a PDF, or None on a cache miss."""
+        if cache_path and cache_path.exists():
+            logger.info(f"Using cached text for {pdf_path}")
+            try:
+                with open(cache_path, 'rb') as f:
+                    return gzip.decompress(f.read()).decode('utf-8')
+            except Exception as e:
+                logger.warning(f"Failed to read cache: {e}")
+        return None
+    
+    def _write_text_cache(self, cache_path: Optional[Path], text: str) -> None:
+        """Store extracted text in the cache, if caching is enabled."""
+        if cache_path:
+            try:
+                with open(cache_path, 'wb') as f:
+                    f.write(gzip.compress(text.encode('utf-8'), compresslevel=TEXT_CACHE_COMPRESSLEVEL))
+            except Exception as e:
+                logger.warning(f"Failed to write cache: {e}")
+    
+    def _extract_text_pymupdf(self, pdf_path: Path, data: Optional[bytes] = None) -> List[str]:
+        """Extract the non-empty text of every page with MuPDF, from data if already read."""
+        doc = pymupdf.open(stream=data, filetype="pdf") if data is not None else pymupdf.open(pdf_path)
+        with doc:
+            return [text for text in (page.get_text("text") for page in doc) if text]
+    
+    @staticmethod
+    def _page_count(pdf_path: Path) -> int:
+        """Return the number of pages in a PDF."""
+        # MuPDF reads the page count without pdfminer parsing every page object
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    
+    def _page_chunks(self, total_pages: int) -> Iterator[range]:
+        """Yield page indices 0..total_pages-1 as page ranges for the workers."""
+        chunk_size = self._chunk_size_for(total_pages)
+        for start in range(0, total_pages, chunk_size):
+            yield range(start, min(start + chunk_size, total_pages))
+    
+    def _chunk_size_for(self, total_pages: int) -> int:
+        """Return the pages per task, about four tasks per worker unless chunk_size is set."""
+        if self.chunk_size:
+            return self.chunk_size
+        return max(1, min(self.max_chunk_size, total_pages // (4 * self.max_workers)))
+    
     def _process_page_chunk(self, pdf_path: Path, page_range: range) -> List[str]:
         """Process a chunk of pages and extract text."""
+        import pdfplumber
+        
         result = []
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for i in page_range:
-                    page = pdf.pages[i]
-                    text = page.extract_text()
+            # Only the pages of this chunk are loaded by the worker
+            with pdfplumber.open(self._read_pdf(pdf_path), pages=[i + 1 for i in page_range]) as pdf:
+                for page in pdf.pages:
+                    text = self._page_text(page)
+                    # Release the page's parsed objects before loading the next one
+                    page.close()
                     if text:
                         result.append(text)
             return result
@@ -135,46 +287,45 @@ class PDFExtractor:
         Raises:
             ParsingException: If table extraction fails
         """
-        # Check cache first
-        cache_path = self._get_cache_path(pdf_path, "tables")
+        # Check cache first; the key hashes the whole file, so it is computed off the loop
+        cache_path = await asyncio.to_thread(self._get_cache_path, pdf_path, "tables")
         if cache_path and cache_path.exists():
             logger.info(f"Using cached tables for {pdf_path}")
             try:
-                with open(cache_path, 'r') as f:
-                    return json.loads(f.read())
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.warning(f"Failed to read table cache: {e}")
         
         try:
             tables = []
             
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                chunks = [range(i, min(i + self.chunk_size, total_pages)) 
-                         for i in range(0, total_pages, self.chunk_size)]
-                
-                # Process chunks in parallel
-                loop = asyncio.get_event_loop()
-                with ProcessPoolExecutor() as executor:
-                    tasks = []
-                    for chunk in chunks:
-                        task = loop.run_in_executor(
-                            executor,
-                            self._process_table_chunk,
-                            pdf_path,
-                            chunk
-                        )
-                        tasks.append(task)
-                    
-                    chunk_results = await asyncio.gather(*tasks)
-                    for result in chunk_results:
-                        tables.extend(result)
+            # Opening the document blocks, so even the page count is read off the loop
+            loop = asyncio.get_event_loop()
+            total_pages = await loop.run_in_executor(None, self._page_count, pdf_path)
+            chunks = self._page_chunks(total_pages)
+            
+            # Process chunks in parallel
+            executor = self._get_executor()
+            tasks = []
+            for chunk in chunks:
+                task = loop.run_in_executor(
+                    executor,
+                    self._process_table_chunk,
+                    pdf_path,
+                    chunk
+                )
+                tasks.append(task)
+            
+            chunk_results = await asyncio.gather(*tasks)
+            for result in chunk_results:
+                tables.extend(result)
             
             # Save to cache
             if cache_path:
                 try:
-                    with open(cache_path, 'w') as f:
-                        f.write(json.dumps(tables))
+                    with open(cache_path, 'wb') as f:
+                        f.write(orjson.dumps(tables))
                 except Exception as e:
                     logger.warning(f"Failed to write table cache: {e}")
             
@@ -182,21 +333,133 @@ class PDFExtractor:
         except Exception as e:
             raise ParsingException(f"Failed to extract tables from {pdf_path}: {e}")
     
+    async def extract_all(self, pdf_path: Path) -> Dict[str, Any]:
+        """
+        Extract text and tables from a PDF file, parsing it with pdfplumber once.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary with "text" and "tables" keys
+            
+        Raises:
+            ParsingException: If extraction fails
+        """
+        text_cache = await asyncio.to_thread(self._get_cache_path, pdf_path, "text")
+        tables_cache = await asyncio.to_thread(self._get_cache_path, pdf_path, "tables")
+        if text_cache and text_cache.exists() and tables_cache.exists():
+            return {
+                "text": await self.extract_text(pdf_path),
+                "tables": await self.extract_tables(pdf_path)
+            }
+        
+        try:
+            loop = asyncio.get_event_loop()
+            full_text, tables = await loop.run_in_executor(None, self._extract_all_sync, pdf_path)
+        except Exception as e:
+            raise ParsingException(f"Failed to extract content from {pdf_path}: {e}")
+        
+        # Save to cache so later extract_text/extract_tables calls are free
+        self._write_text_cache(text_cache, full_text)
+        if tables_cache:
+            try:
+                with open(tables_cache, 'wb') as f:
+                    f.write(orjson.dumps(tables))
+            except Exception as e:
+                logger.warning(f"Failed to write cache: {e}")
+        
+        return {"text": full_text, "tables": tables}
+    
+    def _extract_all_sync(self, pdf_path: Path) -> Tuple[str, List[Dict[str, Any]]]:
+        """Collect page text and tables in a single pass over the document."""
+        import pdfplumber
+        
+        text_content = []
+        tables = []
+        # Both parsers read the same in-memory copy of the file
+        data = Path(pdf_path).read_bytes()
+        # With MuPDF text, pdfminer only has to parse pages that can hold tables
+        pages = self._pages_with_drawings(data) if self.backend == "pymupdf" else None
+        with pdfplumber.open(io.BytesIO(data), pages=pages) as pdf:
+            for page in pdf.pages:
+                if self.backend == "pdfplumber":
+                    text = self._page_text(page)
+                    if text:
+                        text_content.append(text)
+                tables.extend(self._page_tables(page))
+                # Release the page's parsed objects before loading the next one
+                page.close()
+        
+        # MuPDF text is far cheaper than pdfminer's, so it is not taken from the pdfplumber pass
+        if self.backend == "pymupdf":
+            text_content = self._extract_text_pymupdf(pdf_path, data)
+        
+        return '\n'.join(text_content), tables
+    
+    @staticmethod
+    def _pages_with_drawings(data: bytes, page_range: Optional[range] = None) -> List[int]:
+        """
+        Return the 1-based numbers of pages that contain vector drawings.
+        
+        Tables are found from ruling lines, so a page without any line, rect or
+        curve cannot have one. MuPDF answers this without the full pdfminer
+        parse that reading page.edges triggers.
+        
+        Args:
+            data: PDF file contents
+            page_range: 0-based page indices to check. If None, all pages are checked.
+            
+        Returns:
+            Page numbers in ascending order
+        """
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            indices = page_range if page_range is not None else range(doc.page_count)
+            return [i + 1 for i in indices if doc[i].get_drawings()]
+    
+    @staticmethod
+    def _read_pdf(pdf_path: Path) -> io.BytesIO:
+        """Read a PDF in one sequential read so the parser's seeks stay in memory."""
+        return io.BytesIO(Path(pdf_path).read_bytes())
+    
+    @staticmethod
+    def _page_text(page) -> Optional[str]:
+        """Extract a pdfplumber page's text, skipping layout work on pages without characters."""
+        if not page.chars:
+            return None
+        return page.extract_text()
+    
+    @staticmethod
+    def _page_tables(page) -> List[Dict[str, Any]]:
+        """Convert the tables on a pdfplumber page into header-keyed rows."""
+        # The default table strategy finds cells from ruling lines; no edges means no tables
+        if not page.edges:
+            return []
+        rows = []
+        for table in page.extract_tables() or []:
+            if table and len(table) > 1:  # Has headers and data
+                # Interned so tables repeating a header row share one key object per column
+                headers = tuple(sys.intern(h.strip()) for h in table[0] if h)
+                width = len(headers)
+                rows.extend(dict(zip(headers, row)) for row in islice(table, 1, None) if len(row) == width)
+        return rows
+    
     def _process_table_chunk(self, pdf_path: Path, page_range: range) -> List[Dict[str, Any]]:
         """Process a chunk of pages and extract tables."""
+        import pdfplumber
+        
         tables = []
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for i in page_range:
-                    page = pdf.pages[i]
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        for table in page_tables:
-                            if table and len(table) > 1:  # Has headers and data
-                                headers = [h.strip() for h in table[0] if h]
-                                for row in table[1:]:
-                                    if len(row) == len(headers):
-                                        tables.append(dict(zip(headers, row)))
+            data = self._read_pdf(pdf_path)
+            pages = self._pages_with_drawings(data.getvalue(), page_range)
+            if not pages:
+                return tables
+            # Only the pages of this chunk that can hold tables are loaded by the worker
+            with pdfplumber.open(data, pages=pages) as pdf:
+                for page in pdf.pages:
+                    tables.extend(self._page_tables(page))
+                    # Release the page's parsed objects before loading the next one
+                    page.close()
             return tables
         except Exception as e:
             logger.error(f"Error processing table chunk {page_range}: {e}")
@@ -5,43 +5,139 @@ This module contains functions to extract text from PDF files and convert it to
 """
 
 import os
-import json
 import re
-import PyPDF2
-import pdfplumber
+import shutil
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 import hashlib
+import io
+import multiprocessing
+import orjson
 import asyncio
+import ctypes
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from loguru import logger
 from typing import Dict, List, Any, Optional, Tuple, Union
 import time
 import psutil
 
+from dental_scraper.utils.cache import file_content_hash
+
+# Documents shorter than this are extracted by pdfplumber serially; worker start-up would dominate
+PARALLEL_MIN_PAGES = 16
+# Upper bound on worker processes used for one document
+MAX_PAGE_WORKERS = 8
+# Distinct horizontal and vertical rulings a page needs before it is treated as holding a
+# table; underlines, a page border or a logo alone stay on the fast backend
+MIN_TABLE_RULINGS = 3
+# Shortest line segment, in points, that counts as a ruling
+MIN_RULING_LENGTH = 10
+
+
+def _read_pdf(pdf_path):
+    """Read a PDF in one sequential read so the pure-Python parsers' seeks stay in memory."""
+    return io.BytesIO(Path(pdf_path).read_bytes())
+
+
+def _iter_pages_pypdf2(pdf_path):
+    """Yield (page_number, text) pairs for a PDF using PyPDF2."""
+    # Imported on use; the pypdfium2 default path never needs it
+    import PyPDF2
+    
+    reader = PyPDF2.PdfReader(_read_pdf(pdf_path))
+    for page_num, page in enumerate(reader.pages):
+        yield page_num + 1, page.extract_text()
+
+
+def _extract_pdfplumber_pages(pdf_path, page_numbers):
+    """Extract the text of the given 1-based pages with pdfplumber in a worker process."""
+    import pdfplumber
+    
+    with pdfplumber.open(_read_pdf(pdf_path), pages=page_numbers) as pdf:
+        return [page.extract_text() for page in pdf.pages]
+
+
+def _iter_pages_pdfplumber(pdf_path):
+    """
+    Yield (page_number, text) pairs for a PDF using pdfplumber.
+    
+    pdfminer is pure Python, so long documents are split into page ranges
+    and parsed in worker processes; pages are still yielded in order.
+    """
+    # Imported on use; pdfminer.six is slow to import and the default path never needs it
+    import pdfplumber
+    
+    workers = min(MAX_PAGE_WORKERS, os.cpu_count() or 1)
+    # Inside a batch worker the other CPUs are already busy with other PDFs
+    if workers >= 2 and multiprocessing.parent_process() is None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            num_pages = len(pdf)
+        finally:
+            pdf.close()
+        if num_pages >= PARALLEL_MIN_PAGES:
+            yield from _iter_pages_pdfplumber_parallel(pdf_path, num_pages, workers)
+            return
+    
+    with pdfplumber.open(_read_pdf(pdf_path)) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            yield page_num + 1, page.extract_text()
+
+
+def _iter_pages_pdfplumber_parallel(pdf_path, num_pages, workers):
+    """Yield (page_number, text) pairs from contiguous page ranges parsed by a worker pool."""
+    chunk_size = -(-num_pages // workers)
+    chunks = [list(range(start + 1, min(start + chunk_size, num_pages) + 1))
+              for start in range(0, num_pages, chunk_size)]
+    page_num = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for texts in executor.map(_extract_pdfplumber_pages, [pdf_path] * len(chunks), chunks):
+            for text in texts:
+                page_num += 1
+                yield page_num, text
+
+
+def _iter_pages_pypdfium2(pdf_path):
+    """Yield (page_number, text) pairs for a PDF using pypdfium2."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page_num, page in enumerate(pdf):
+            textpage = page.get_textpage()
+            # PDFium ends lines with \r\n; the other backends use \n
+            text = textpage.get_text_range().replace('\r\n', '\n')
+            textpage.close()
+            yield page_num + 1, text
+            page.close()
+    finally:
+        pdf.close()
+
+
+def _iter_pages_pymupdf(pdf_path):
+    """Yield (page_number, text) pairs for a PDF using PyMuPDF."""
+    # Imported on use; the pypdfium2 default path never needs it
+    import pymupdf
+    
+    with pymupdf.open(pdf_path) as doc:
+        for page_num, page in enumerate(doc):
+            yield page_num + 1, page.get_text("text")
+
 
 def extract_text_with_pypdf2(pdf_path):
     """
     Extract text from a PDF file using PyPDF2.
     
+    PyPDF2 is pure Python and the slowest backend; it is kept for parity
+    with previously generated output. Prefer pypdfium2.
+    
     Args:
         pdf_path (str): Path to the PDF file
         
     Returns:
         dict: Dictionary containing the extracted text with page numbers as keys
     """
-    result = {}
-    
-    with open(pdf_path, "rb") as file:
-        reader = PyPDF2.PdfReader(file)
-        num_pages = len(reader.pages)
-        
-        for page_num in range(num_pages):
-            page = reader.pages[page_num]
-            text = page.extract_text()
-            result[f"page_{page_num + 1}"] = text
-    
-    return result
+    return {f"page_{page_num}": text for page_num, text in _iter_pages_pypdf2(pdf_path)}
 
 
 def extract_text_with_pdfplumber(pdf_path):
@@ -57,96 +153,304 @@ def extract_text_with_pdfplumber(pdf_path):
     Returns:
         dict: Dictionary containing the extracted text with page numbers as keys
     """
-    result = {}
+    return {f"page_{page_num}": text for page_num, text in _iter_pages_pdfplumber(pdf_path)}
+
+
+def extract_text_with_pypdfium2(pdf_path):
+    """
+    Extract text from a PDF file using pypdfium2.
     
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages):
-            text = page.extract_text()
-            result[f"page_{page_num + 1}"] = text
+    pypdfium2 binds Google's PDFium C++ library and is the fastest of the
+    available backends.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        dict: Dictionary containing the extracted text with page numbers as keys
+    """
+    return {f"page_{page_num}": text for page_num, text in _iter_pages_pypdfium2(pdf_path)}
+
+
+def extract_text_with_pymupdf(pdf_path):
+    """
+    Extract text from a PDF file using PyMuPDF.
     
-    return result
+    PyMuPDF binds the MuPDF C library and runs at about the same speed as
+    pypdfium2; its text keeps plain newline line endings.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        dict: Dictionary containing the extracted text with page numbers as keys
+    """
+    return {f"page_{page_num}": text for page_num, text in _iter_pages_pymupdf(pdf_path)}
+
+
+# CDT procedure codes: D followed by 4 digits
+_CDT_CODE_RE = re.compile(r'D\d{4}')
+
+# Body of a procedure block after its code, up to the next code or the end of the text
+_PROCEDURE_BODY_RE = re.compile(r'[\s\S]{10,1000}?(?=D\d{4}|\Z)')
+
+# Text extraction backends selectable through the ``method`` argument
+EXTRACTION_METHODS = {
+    "pypdfium2": _iter_pages_pypdfium2,
+    "pymupdf": _iter_pages_pymupdf,
+    "pypdf2": _iter_pages_pypdf2,
+    "pdfplumber": _iter_pages_pdfplumber,
+}
+
+
+def _iter_pages(pdf_path, method):
+    """Yield (page_number, text) pairs using the backend named by method."""
+    try:
+        iter_pages = EXTRACTION_METHODS[method.lower()]
+    except KeyError:
+        raise ValueError(f"Method must be one of {', '.join(map(repr, EXTRACTION_METHODS))}")
+    return iter_pages(pdf_path)
+
 
+def _extract_with(pdf_path, method):
+    """Extract all pages into a dict using the backend named by method."""
+    return {f"page_{page_num}": text for page_num, text in _iter_pages(pdf_path, method)}
 
-def pdf_to_json(pdf_path, output_path=None, method="pypdf2"):
+
+def pdf_to_json(pdf_path, output_path=None, method="pypdfium2"):
     """
     Convert a PDF file to a JSON file.
     
+    Pages are encoded and written one at a time, so only the page being
+    processed is held in memory.
+    
     Args:
         pdf_path (str): Path to the PDF file
         output_path (str, optional): Path to save the JSON file. If None, the output is saved in the same directory as the PDF file.
-        method (str, optional): Method to use for text extraction. Default is "pypdf2".
+        method (str, optional): Method to use for text extraction. Default is "pypdfium2".
         
     Returns:
         str: Path to the saved JSON file
     """
-    if method.lower() == "pypdf2":
-        extracted_text = extract_text_with_pypdf2(pdf_path)
-    elif method.lower() == "pdfplumber":
-        extracted_text = extract_text_with_pdfplumber(pdf_path)
-    else:
-        raise ValueError("Method must be either 'pypdf2' or 'pdfplumber'")
+    pages = _iter_pages(pdf_path, method)
     
     # If output_path is not provided, save the output in the same directory as the PDF file
     if output_path is None:
         output_path = pdf_path.replace(".pdf", ".json")
     
-    with open(output_path, "w") as f:
-        json.dump(extracted_text, f, indent=4)
+    try:
+        with open(output_path, "wb") as f:
+            separator = b"{"
+            for page_num, text in pages:
+                f.write(separator)
+                f.write(orjson.dumps(f"page_{page_num}"))
+                f.write(b":")
+                f.write(orjson.dumps(text))
+                separator = b","
+            f.write(b"}" if separator == b"," else b"{}")
+    except Exception:
+        # Do not leave a truncated JSON document behind
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+    
+    return output_path
+
+
+def _convert_pdf_worker(pdf_path, output_path, method, cache_path=None):
+    """
+    Convert one PDF to JSON in a worker process for PDFProcessor.batch_process.
     
+    The extracted pages are encoded once and written both to the output file
+    and, when caching is enabled, to the processor's text cache.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_path (str): Path to save the JSON file
+        method (str): Method to use for text extraction
+        cache_path (Path, optional): Cache file to populate
+        
+    Returns:
+        str: Path to the saved JSON file
+    """
+    encoded = orjson.dumps(_extract_with(pdf_path, method))
+    with open(output_path, "wb") as f:
+        f.write(encoded)
+    if cache_path is not None:
+        try:
+            with open(cache_path, "wb") as f:
+                f.write(encoded)
+        except OSError as e:
+            logger.warning(f"Failed to write cache: {e}")
     return output_path
 
 
-def batch_process_pdfs(pdf_directory, output_directory=None, method="pypdf2"):
+def _file_sha256(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _pdf_to_json_worker(task):
+    """Run pdf_to_json for one (pdf_path, output_path, method) task in a worker process."""
+    return pdf_to_json(*task)
+
+
+def batch_process_pdfs(pdf_directory, output_directory=None, method="pypdfium2", max_workers=None):
     """
     Process all PDF files in a directory.
     
+    PDFs are converted in parallel worker processes. Files with identical
+    contents are only parsed once; the JSON for duplicates is copied.
+    
     Args:
         pdf_directory (str): Directory containing PDF files
         output_directory (str, optional): Directory to save the output JSON files. If None, the output is saved in the same directory as the PDF files.
-        method (str, optional): Method to use for text extraction. Default is "pypdf2".
+        method (str, optional): Method to use for text extraction. Default is "pypdfium2".
+        max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
         
     Returns:
         list: List of paths to the saved JSON files
     """
-    pdf_files = [f for f in os.listdir(pdf_directory) if f.endswith(".pdf")]
-    output_files = []
+    # scandir entries carry the file type from the directory listing, so no per-file stat is needed
+    with os.scandir(pdf_directory) as entries:
+        pdf_files = [entry for entry in entries if entry.name.endswith(".pdf") and entry.is_file()]
     
-    for pdf_file in pdf_files:
-        pdf_path = os.path.join(pdf_directory, pdf_file)
+    tasks = []
+    duplicates = []
+    first_by_hash = {}
+    for index, entry in enumerate(pdf_files):
+        pdf_path = entry.path
         
         if output_directory is not None:
-            output_file = os.path.join(output_directory, pdf_file.replace(".pdf", ".json"))
+            output_file = os.path.join(output_directory, entry.name.replace(".pdf", ".json"))
         else:
             output_file = None
         
-        output_path = pdf_to_json(pdf_path, output_file, method)
-        output_files.append(output_path)
+        content_hash = _file_sha256(pdf_path)
+        if content_hash in first_by_hash:
+            duplicates.append((index, first_by_hash[content_hash], pdf_path, output_file))
+            continue
+        
+        first_by_hash[content_hash] = index
+        tasks.append((index, (pdf_path, output_file, method)))
+    
+    output_files = [None] * len(pdf_files)
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if workers < 2:
+        # Spawning a pool costs more than it saves for a single file or worker
+        results = map(_pdf_to_json_worker, [task for _, task in tasks])
+        for (index, _), output_path in zip(tasks, results):
+            output_files[index] = output_path
+    else:
+        # Hand out several files per dispatch so large batches of small PDFs
+        # are not dominated by inter-process round trips
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_pdf_to_json_worker, [task for _, task in tasks], chunksize=chunksize)
+            for (index, _), output_path in zip(tasks, results):
+                output_files[index] = output_path
+    
+    for index, source_index, pdf_path, output_file in duplicates:
+        output_path = output_file or pdf_path.replace(".pdf", ".json")
+        shutil.copyfile(output_files[source_index], output_path)
+        output_files[index] = output_path
     
     return output_files
 
 
+def _has_table_rulings(page):
+    """
+    Check whether a pdfium page draws a grid of ruling lines.
+    
+    Straight path segments (including rectangle edges) are classified as
+    horizontal or vertical, and their positions rounded to whole points. A
+    table needs MIN_TABLE_RULINGS distinct positions in both directions,
+    the same line grid pdfplumber's default table strategy looks for.
+    
+    Args:
+        page: pypdfium2 page
+        
+    Returns:
+        bool: True if the page has enough rulings to hold a table
+    """
+    rows, columns = set(), set()
+    x, y = ctypes.c_float(), ctypes.c_float()
+    # Form XObjects are searched too
+    for obj in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_PATH,)):
+        matrix = obj.get_matrix()
+        start = current = None
+        for index in range(pdfium_c.FPDFPath_CountSegments(obj.raw)):
+            segment = pdfium_c.FPDFPath_GetPathSegment(obj.raw, index)
+            pdfium_c.FPDFPathSegment_GetPoint(segment, x, y)
+            point = matrix.on_point(x.value, y.value)
+            segment_type = pdfium_c.FPDFPathSegment_GetType(segment)
+            ends = []
+            if segment_type == pdfium_c.FPDF_SEGMENT_MOVETO:
+                start = point
+            elif segment_type == pdfium_c.FPDF_SEGMENT_LINETO and current is not None:
+                ends.append((current, point))
+            current = point
+            if pdfium_c.FPDFPathSegment_GetClose(segment) and start is not None:
+                ends.append((current, start))
+                current = start
+            
+            for (x0, y0), (x1, y1) in ends:
+                if abs(y1 - y0) < 1 and abs(x1 - x0) >= MIN_RULING_LENGTH:
+                    rows.add(round(y0))
+                elif abs(x1 - x0) < 1 and abs(y1 - y0) >= MIN_RULING_LENGTH:
+                    columns.add(round(x0))
+            if len(rows) >= MIN_TABLE_RULINGS and len(columns) >= MIN_TABLE_RULINGS:
+                return True
+    return False
+
+
+def _page_sort_key(page_key):
+    """Order "page_N" keys numerically, so page_10 follows page_9; other keys sort last."""
+    _, _, number = page_key.rpartition("_")
+    return (0, int(number), page_key) if number.isdigit() else (1, 0, page_key)
+
+
 class PerformanceMonitor:
     """
     Utility class for monitoring performance metrics of PDF processing.
     """
     
-    def __init__(self):
-        """Initialize the performance monitor."""
+    def __init__(self, sample_memory: bool = False):
+        """
+        Initialize the performance monitor.
+        
+        Args:
+            sample_memory: Whether to record process memory. Reading it costs a
+                           /proc read per call, which is noticeable on short PDFs.
+        """
         self.start_time = None
         self.end_time = None
         self.start_memory = None
         self.end_memory = None
         self.metrics = {}
+        self.sample_memory = sample_memory
+        # Opened once; memory_info() reuses the handle instead of looking the process up again
+        self._process = psutil.Process(os.getpid()) if sample_memory else None
+    
+    def _memory_mb(self) -> float:
+        """Return the process RSS in MB, or 0 when memory sampling is off."""
+        if self._process is None:
+            return 0
+        return self._process.memory_info().rss / (1024 * 1024)
     
     def start(self):
         """Start monitoring performance."""
-        self.start_time = time.time()
-        self.start_memory = psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)  # MB
+        self.start_time = time.perf_counter()
+        self.start_memory = self._memory_mb()
     
     def stop(self):
         """Stop monitoring performance and calculate metrics."""
-        self.end_time = time.time()
-        self.end_memory = psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)  # MB
+        self.end_time = time.perf_counter()
+        self.end_memory = self._memory_mb()
         
         self.metrics = {
             "execution_time": self.end_time - self.start_time,
@@ -160,8 +464,9 @@ class PerformanceMonitor:
         """Log performance metrics."""
         logger.info(f"Performance metrics for {operation}:")
         logger.info(f"Execution time: {self.metrics['execution_time']:.2f} seconds")
-        logger.info(f"Memory used: {self.metrics['memory_used']:.2f} MB")
-        logger.info(f"Peak memory: {self.metrics['peak_memory']:.2f} MB")
+        if self.sample_memory:
+            logger.info(f"Memory used: {self.metrics['memory_used']:.2f} MB")
+            logger.info(f"Peak memory: {self.metrics['peak_memory']:.2f} MB")
 
 
 class PDFProcessor:
@@ -181,6 +486,8 @@ class PDFProcessor:
         logger.info("Initializing PDFProcessor")
         self.cache_dir = cache_dir
         self.max_workers = max_workers or os.cpu_count()
+        # Worker pool for extraction, started on first use and reused by later calls and batches
+        self._pool: Optional[ProcessPoolExecutor] = None
         
         if self.cache_dir:
             os.makedirs(self.cache_dir, exist_ok=True)
@@ -188,50 +495,78 @@ class PDFProcessor:
             
         self.monitor = PerformanceMonitor()
     
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    async def __aenter__(self) -> "PDFProcessor":
+        """Return the processor for use in an async with block."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Shut down the worker pool when the async with block exits."""
+        self.close()
+    
     def _get_cache_path(self, pdf_path: Union[str, Path], operation: str) -> Optional[Path]:
         """Generate a cache file path for a PDF."""
         if not self.cache_dir:
             return None
             
-        pdf_hash = hashlib.md5(str(pdf_path).encode()).hexdigest()
+        # Keyed on content, so renamed copies hit and overwritten files miss
+        try:
+            pdf_hash = file_content_hash(pdf_path)
+        except OSError:
+            # Unreadable files are not cached; extraction reports the error
+            return None
         return Path(self.cache_dir) / f"{pdf_hash}_{operation}.json"
     
     def _determine_best_method(self, pdf_path: Union[str, Path]) -> str:
         """
         Determine the best extraction method based on PDF characteristics.
         
-        Simple PDFs work well with PyPDF2 which is faster.
-        Complex PDFs with tables and multiple columns need pdfplumber.
+        Most PDFs work well with pypdfium2 which is fastest.
+        Pages with table rulings or multiple columns need pdfplumber's layout analysis.
         """
         try:
-            # Check file size - larger PDFs often have complex layouts
-            file_size = os.path.getsize(pdf_path) / (1024 * 1024)  # Size in MB
+            # Check the first page for table rulings or complex layouts
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                first_page = pdf[0]
+                try:
+                    # Tables are drawn with ruling lines. Found rulings settle it without reading text
+                    if _has_table_rulings(first_page):
+                        return "pdfplumber"
+                    
+                    # Try to determine if it has multiple columns using extracted text
+                    textpage = first_page.get_textpage()
+                    text = textpage.get_text_range().replace('\r\n', '\n')
+                    textpage.close()
+                finally:
+                    first_page.close()
+            finally:
+                pdf.close()
             
-            # Check if the PDF has images or complex layouts
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                first_page = reader.pages[0]
-                
-                # Check for /XObject in resources, which often indicates images
-                has_images = False
-                if hasattr(first_page, 'resources') and '/XObject' in first_page.resources:
-                    has_images = True
-                
-                # Try to determine if it has multiple columns using extracted text
-                text = first_page.extract_text()
-                has_multiple_columns = False
-                if text:
-                    lines = text.split('\n')
-                    if len(lines) > 5:
-                        # Check if there are short lines in a pattern that suggests columns
-                        short_lines = [line for line in lines if len(line) < 30]
-                        if len(short_lines) > len(lines) * 0.5:
-                            has_multiple_columns = True
+            has_multiple_columns = False
+            if text:
+                lines = text.split('\n')
+                if len(lines) > 5:
+                    # Check if there are short lines in a pattern that suggests columns
+                    short_lines = sum(1 for line in lines if len(line) < 30)
+                    if short_lines > len(lines) * 0.5:
+                        has_multiple_columns = True
             
-            # Decision logic
-            if file_size > 10 or has_images or has_multiple_columns:
+            # Decision logic; pdfplumber is far slower, so it is reserved for layouts that need it
+            if has_multiple_columns:
                 return "pdfplumber"
-            return "pypdf2"
+            return "pypdfium2"
         except Exception as e:
             logger.warning(f"Error determining extraction method: {e}, defaulting to pdfplumber")
             return "pdfplumber"
@@ -242,7 +577,7 @@ class PDFProcessor:
         
         Args:
             pdf_path: Path to the PDF file
-            method: Method to use for extraction (pypdf2 or pdfplumber). 
+            method: Method to use for extraction (pypdfium2, pymupdf, pypdf2 or pdfplumber). 
                     If None, the best method is automatically determined.
             
         Returns:
@@ -251,13 +586,14 @@ class PDFProcessor:
         pdf_path = str(pdf_path)
         logger.info(f"Extracting text from {pdf_path}")
         
-        # Check cache first
-        cache_path = self._get_cache_path(pdf_path, "text")
+        # Check cache first; the key hashes the whole file, so it is computed off the loop
+        loop = asyncio.get_running_loop()
+        cache_path = await loop.run_in_executor(None, self._get_cache_path, pdf_path, "text")
         if cache_path and cache_path.exists():
             logger.info(f"Using cached text for {pdf_path}")
             try:
-                with open(cache_path, 'r') as f:
-                    return json.loads(f.read())
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.warning(f"Failed to read cache: {e}")
         
@@ -270,18 +606,14 @@ class PDFProcessor:
         self.monitor.start()
         
         try:
-            if method.lower() == "pypdf2":
-                result = extract_text_with_pypdf2(pdf_path)
-            elif method.lower() == "pdfplumber":
-                result = extract_text_with_pdfplumber(pdf_path)
-            else:
-                raise ValueError("Method must be either 'pypdf2' or 'pdfplumber'")
+            # Parsing is CPU-bound; running it in the worker pool keeps the event loop free
+            result = await loop.run_in_executor(self._get_pool(), _extract_with, pdf_path, method)
                 
             # Save to cache
             if cache_path:
                 try:
-                    with open(cache_path, 'w') as f:
-                        f.write(json.dumps(result))
+                    with open(cache_path, 'wb') as f:
+                        f.write(orjson.dumps(result))
                 except Exception as e:
                     logger.warning(f"Failed to write cache: {e}")
                     
@@ -316,8 +648,9 @@ class PDFProcessor:
             if output_path is None:
                 output_path = pdf_path.replace(".pdf", ".json")
             
-            with open(output_path, "w") as f:
-                json.dump(extracted_text, f, indent=4)
+            # Compact orjson output, the same layout the module-level pdf_to_json streams
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(extracted_text))
             
             return output_path
         finally:
@@ -330,6 +663,9 @@ class PDFProcessor:
         """
         Process all PDF files in a directory in parallel.
         
+        Extraction is CPU-bound, so uncached PDFs are converted in worker
+        processes; PDFs already in the cache are written from it directly.
+        
         Args:
             pdf_directory: Directory containing PDF files
             output_directory: Directory to save JSON files
@@ -344,20 +680,36 @@ class PDFProcessor:
         self.monitor.start()
         
         try:
-            pdf_files = [f for f in os.listdir(pdf_directory) if f.endswith(".pdf")]
+            with os.scandir(pdf_directory) as entries:
+                pdf_files = [entry for entry in entries if entry.name.endswith(".pdf") and entry.is_file()]
             output_files = []
             
             # Process PDFs in parallel
+            loop = asyncio.get_running_loop()
+            # Cache keys hash each file's contents, so they are computed off the loop
+            cache_paths = await asyncio.gather(*(
+                loop.run_in_executor(None, self._get_cache_path, entry.path, "text") for entry in pdf_files
+            ))
             tasks = []
-            for pdf_file in pdf_files:
-                pdf_path = os.path.join(pdf_directory, pdf_file)
+            for entry, cache_path in zip(pdf_files, cache_paths):
+                pdf_path = entry.path
                 
                 if output_directory is not None:
-                    output_file = os.path.join(str(output_directory), pdf_file.replace(".pdf", ".json"))
+                    output_file = os.path.join(str(output_directory), entry.name.replace(".pdf", ".json"))
                 else:
-                    output_file = None
+                    output_file = pdf_path.replace(".pdf", ".json")
                 
-                task = self.pdf_to_json(pdf_path, output_file, method)
+                if cache_path and cache_path.exists():
+                    task = self.pdf_to_json(pdf_path, output_file, method)
+                else:
+                    task = loop.run_in_executor(
+                        self._get_pool(),
+                        _convert_pdf_worker,
+                        pdf_path,
+                        output_file,
+                        method or self._determine_best_method(pdf_path),
+                        cache_path
+                    )
                 tasks.append(task)
             
             # Wait for all tasks to complete
@@ -368,7 +720,7 @@ class PDFProcessor:
             self.monitor.stop()
             self.monitor.log_metrics("batch processing")
     
-    async def process_content(self, content: Dict[str, str]) -> str:
+    def process_content(self, content: Dict[str, str]) -> str:
         """
         Process the extracted PDF content into a structured format.
         
@@ -382,13 +734,9 @@ class PDFProcessor:
         if not content:
             return ""
         
-        combined_text = ""
-        for page_num in sorted(content.keys()):
-            combined_text += content[page_num] + "\n\n"
-        
-        return combined_text
+        # Join once instead of re-copying the accumulated text for every page
+        return "".join(content[page_num] + "\n\n" for page_num in sorted(content, key=_page_sort_key))
 
-    @lru_cache(maxsize=100)
     def extract_procedure_codes(self, text: str) -> List[str]:
         """
         Extract CDT procedure codes from text.
@@ -401,16 +749,8 @@ class PDFProcessor:
         """
         logger.debug("Extracting procedure codes")
         
-        # Define the pattern for CDT procedure codes (D followed by 4 digits)
-        pattern = r'D\d{4}'
-        
-        # Find all matches in the text
-        matches = re.findall(pattern, text)
-        
-        # Remove duplicates and sort
-        unique_codes = sorted(list(set(matches)))
-        
-        return unique_codes
+        # Find all matches in the text, remove duplicates and sort
+        return sorted(set(_CDT_CODE_RE.findall(text)))
 
     async def extract_procedures(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -424,16 +764,25 @@ class PDFProcessor:
         """
         logger.debug("Extracting procedures")
         
-        # Get procedure codes
-        codes = self.extract_procedure_codes(text)
+        # Locate every code in one scan instead of searching the text once per code
+        occurrences: Dict[str, List[int]] = {}
+        for match in _CDT_CODE_RE.finditer(text):
+            occurrences.setdefault(match.group(), []).append(match.start())
         
         procedures = []
         
         # Process each code
-        for code in codes:
-            # Find text sections containing the code
-            pattern = fr'{code}[\s\S]{{10,1000}}?(?=D\d{{4}}|\Z)'
-            matches = re.findall(pattern, text)
+        for code in sorted(occurrences):
+            # Find text sections containing the code; like findall, sections do not overlap
+            matches = []
+            section_end = 0
+            for start in occurrences[code]:
+                if start < section_end:
+                    continue
+                body = _PROCEDURE_BODY_RE.match(text, start + len(code))
+                if body:
+                    section_end = body.end()
+                    matches.append(text[start:section_end])
             
             if matches:
                 description = ""
@@ -449,16 +798,17 @@ class PDFProcessor:
                     
                     # Look for requirements
                     req_section = False
-                    for line in lines[1:]:
+                    for line in islice(lines, 1, None):
                         line = line.strip()
                         if not line:
                             continue
                             
-                        if 'requirement' in line.lower() or 'documentation' in line.lower():
+                        lowered = line.lower()
+                        if 'requirement' in lowered or 'documentation' in lowered:
                             req_section = True
                             continue
                             
-                        if req_section and line and not line.startswith('D'):
+                        if req_section and not line.startswith('D'):
                             requirements.append(line)
                 
                 procedures.append({
@@ -8,6 +8,20 @@ import os
 from pathlib import Path
 import scrapy
 from scrapy.http import Request
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
+
+
+def _write_file(file_path, data):
+    """Write bytes straight to a file descriptor, bypassing the buffered writer."""
+    view = memoryview(data)
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked for; continue from where it stopped
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 class PDFSpider(scrapy.Spider):
@@ -62,10 +76,13 @@ class PDFSpider(scrapy.Spider):
         if next_page:
             yield response.follow(next_page, callback=self.parse)
 
-    def save_pdf(self, response):
+    async def save_pdf(self, response):
         """
         Save the downloaded PDF file.
         
+        The write runs in the reactor thread pool so large bodies do not
+        block other downloads.
+        
         Args:
             response: The response object containing the PDF data
             
@@ -75,13 +92,13 @@ class PDFSpider(scrapy.Spider):
         filename = response.meta.get("filename")
         file_path = os.path.join(self.pdf_dir, filename)
         
-        # Create parent directories if they don't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        # Save the PDF file
-        with open(file_path, "wb") as f:
-            f.write(response.body)
-            
+        # Save the PDF file; pdf_dir is created once in __init__
+        d = deferToThread(_write_file, file_path, response.body)
+        d.addCallback(self._pdf_saved, response, filename, file_path)
+        return await maybe_deferred_to_future(d)
+
+    def _pdf_saved(self, _, response, filename, file_path):
+        """Log the saved file and build the item describing it."""
         # Log the saved file path
         self.logger.info(f"Saved PDF file: {file_path}")
         
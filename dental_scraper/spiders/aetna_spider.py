@@ -7,22 +7,71 @@ from datetime import datetime
 import re
 import json
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 import logging
 
 from scrapy.http import Request, Response, FormRequest
 from loguru import logger
-import pdfplumber
+import ahocorasick
 from bs4 import BeautifulSoup
 from scrapy import Spider
 from scrapy.exceptions import IgnoreRequest
 
 from ..models import CarrierGuidelines, Procedure, DataValidator
+from ..utils.pdf_processor import PDFProcessor
 from .base_spider import BaseInsuranceSpider
 
 # Load environment variables
 load_dotenv()
 
+# Keywords marking a PDF link on the guidelines page as relevant
+_PDF_LINK_KEYWORDS = ('dental', 'guidelines', 'policies', 'procedures', 'coverage', 'clinical', 'bulletin')
+
+# One Aho-Corasick automaton finds any keyword in a single scan of the link
+_PDF_LINK_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _keyword in _PDF_LINK_KEYWORDS:
+    _PDF_LINK_KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+_PDF_LINK_KEYWORD_AUTOMATON.make_automaton()
+
+# Patterns used by extract_procedures on every section, compiled once
+_SECTION_SPLIT_PATTERN = re.compile(r'\n(?=(?:SECTION|CATEGORY|PROCEDURES|GUIDELINES|POLICY)\s+[IVX0-9]+[.:)])')
+_PAGE_PATTERN = re.compile(r'Page (\d+)')
+# Cheap pre-check: every code pattern below needs a D followed by four digits
+_ANY_CODE_PATTERN = re.compile(r'D\d{4}', re.IGNORECASE)
+_CODE_PATTERNS = [
+    re.compile(r'D\d{4}(?=\s|$|\)|\]|\.)', re.IGNORECASE),  # Standard CDT code
+    re.compile(r'(?<=Code\s)D\d{4}', re.IGNORECASE),        # Code prefixed
+    re.compile(r'(?<=CDT\s)D\d{4}', re.IGNORECASE),         # CDT prefixed
+    re.compile(r'(?<=procedure\s)D\d{4}', re.IGNORECASE)    # Procedure prefixed
+]
+_REQUIREMENT_PATTERNS = [
+    re.compile(rf'({indicator}[^.;]*[.;])', re.IGNORECASE)
+    for indicator in (
+        'required', 'must', 'should', 'need', 'necessary',
+        'documentation', 'criteria', 'prerequisite',
+        'condition', 'requirement'
+    )
+]
+_LIMITATION_PATTERNS = [
+    re.compile(rf'({indicator}[^.;]*[.;])', re.IGNORECASE)
+    for indicator in (
+        'limit', 'maximum', 'minimum', 'restricted',
+        'not covered', 'excluded', 'only when',
+        'frequency', 'interval'
+    )
+]
+
+@lru_cache(maxsize=None)
+def _description_patterns(code: str) -> Tuple[re.Pattern, ...]:
+    """Compile the description patterns for a CDT code once per code."""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        rf'{code}\s*[-:]+\s*([^.]*\.)',
+        rf'{code}\s+([^.]*\.)',
+        rf'{code}\s*\(([^)]*)\)',
+        rf'{code}\s*\[([^\]]*)\]'
+    ))
+
 # Set up logging
 log_dir = os.path.join('logs', 'aetna')
 os.makedirs(log_dir, exist_ok=True)
@@ -72,6 +121,7 @@ class AetnaSpider(Spider):
         self.logger.info(f"Initialized {self.name} spider")
         self.pdf_dir = os.path.join('data', 'pdfs', self.name)
         os.makedirs(self.pdf_dir, exist_ok=True)
+        self.validator = DataValidator()
         
     def start_requests(self):
         """Start with the login page."""
@@ -192,12 +242,12 @@ class AetnaSpider(Spider):
         # Look for PDF links
         for link in soup.find_all('a', href=True):
             href = link.get('href', '')
-            text = link.get_text().lower()
+            href_lower = href.lower()
             
             # Check if link points to a PDF
-            if href.lower().endswith('.pdf') or 'pdf' in href.lower():
-                if any(keyword in text.lower() or keyword in href.lower() for keyword in 
-                      ['dental', 'guidelines', 'policies', 'procedures', 'coverage', 'clinical', 'bulletin']):
+            if 'pdf' in href_lower:
+                text = link.get_text().lower()
+                if next(_PDF_LINK_KEYWORD_AUTOMATON.iter(f"{text}\n{href_lower}"), None) is not None:
                     pdf_url = response.urljoin(href)
                     self.logger.info(f"Found PDF link: {pdf_url}")
                     yield Request(
@@ -213,7 +263,10 @@ class AetnaSpider(Spider):
             self.logger.warning(f"Invalid PDF response from {response.url}")
             return
 
-        filename = os.path.join(self.pdf_dir, f"{self.name}_guidelines_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
+        # One timestamp names the file and dates every item extracted from it
+        now = datetime.now()
+        extracted_date = now.isoformat()
+        filename = os.path.join(self.pdf_dir, f"{self.name}_guidelines_{now:%Y%m%d_%H%M%S}.pdf")
         
         try:
             # Save PDF file
@@ -222,17 +275,18 @@ class AetnaSpider(Spider):
             
             procedures = self.extract_procedures(filename)
             if procedures:
-                validator = DataValidator()
-                for procedure in procedures:
+                # Validate all procedures in one batch
+                results = self.validator.validate_procedures_batch(procedures)
+                for procedure, (is_valid, validated_procedure, errors) in zip(procedures, results):
                     try:
-                        # Validate procedure data
-                        is_valid, validated_procedure, errors = validator.validate_procedure_data(procedure)
+                        # Remember the outcome for quality reports
+                        procedure['_valid'] = is_valid
                         if is_valid:
                             yield {
                                 'carrier': 'Aetna',
                                 'source_url': response.url,
-                                'procedure': validated_procedure.dict(),
-                                'extracted_date': datetime.now().isoformat(),
+                                'procedure': validated_procedure.model_dump(),
+                                'extracted_date': extracted_date,
                                 'file_name': os.path.basename(filename)
                             }
                         else:
@@ -251,116 +305,89 @@ class AetnaSpider(Spider):
     def extract_procedures(self, pdf_path: str) -> List[Dict]:
         """Extract dental procedures from a PDF file."""
         procedures = []
+        seen_codes = set()
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # First pass: collect all text to analyze document structure
-                full_text = ""
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        full_text += f"\n--- Page {page.page_number} ---\n{text}"
+            # First pass: collect all text to analyze document structure.
+            # Only text is needed, so PDFium is used instead of pdfplumber
+            page_texts = []
+            for page_number, text in enumerate(PDFProcessor.extract_page_texts_fast(pdf_path), 1):
+                if text:
+                    page_texts.append(f"\n--- Page {page_number} ---\n{text}")
+            full_text = "".join(page_texts)
 
-                # Look for sections that might contain procedures
-                sections = re.split(r'\n(?=(?:SECTION|CATEGORY|PROCEDURES|GUIDELINES|POLICY)\s+[IVX0-9]+[.:)])', full_text)
+            # Look for sections that might contain procedures
+            sections = _SECTION_SPLIT_PATTERN.split(full_text)
+            
+            for section in sections:
+                # Skip empty sections and sections without any CDT code
+                if not section.strip() or not _ANY_CODE_PATTERN.search(section):
+                    continue
+                    
+                page_match = _PAGE_PATTERN.search(section)
+                source_page = int(page_match.group(1)) if page_match else 1
                 
-                for section in sections:
-                    # Skip empty sections
-                    if not section.strip():
-                        continue
+                # Look for procedure codes with various formats
+                for pattern in _CODE_PATTERNS:
+                    matches = pattern.finditer(section)
+                    for match in matches:
+                        code = match.group()
+                        # Only the first occurrence of a code is kept; skip the context work
+                        if code in seen_codes:
+                            continue
+                        pos = match.start()
+                        
+                        # Get context (up to 1000 characters around the code) as
+                        # offsets into the section rather than a sliced copy
+                        start = max(0, pos - 500)
+                        end = min(len(section), pos + 500)
+                        
+                        # Extract description using multiple patterns
+                        description = None
+                        for desc_pattern in _description_patterns(code):
+                            desc_match = desc_pattern.search(section, start, end)
+                            if desc_match:
+                                description = desc_match.group(1).strip()
+                                break
+                        
+                        if not description:
+                            continue
+                        
+                        # Extract requirements
+                        requirements = []
+                        
+                        # Look for requirements in the context
+                        for indicator_pattern in _REQUIREMENT_PATTERNS:
+                            req_matches = indicator_pattern.finditer(section, start, end)
+                            for req_match in req_matches:
+                                req = req_match.group(1).strip()
+                                if req not in requirements:
+                                    requirements.append(req)
+                        
+                        # Extract limitations
+                        limitations = []
+                        
+                        # Look for limitations in the context
+                        for indicator_pattern in _LIMITATION_PATTERNS:
+                            limit_matches = indicator_pattern.finditer(section, start, end)
+                            for limit_match in limit_matches:
+                                limit = limit_match.group(1).strip()
+                                if limit not in limitations:
+                                    limitations.append(limit)
+                        
+                        # Create the procedure object
+                        procedure = {
+                            'code': code,
+                            'description': description,
+                            'requirements': requirements or ['No specific requirements listed'],
+                            'limitations': limitations or ['No specific limitations listed'],
+                            'source_page': source_page
+                        }
+                        
+                        seen_codes.add(code)
+                        procedures.append(procedure)
+                        self.logger.info(f"Extracted procedure {code}")
                         
-                    # Look for procedure codes with various formats
-                    code_patterns = [
-                        r'D\d{4}(?=\s|$|\)|\]|\.)',  # Standard CDT code
-                        r'(?<=Code\s)D\d{4}',        # Code prefixed
-                        r'(?<=CDT\s)D\d{4}',         # CDT prefixed
-                        r'(?<=procedure\s)D\d{4}'    # Procedure prefixed
-                    ]
-                    
-                    for pattern in code_patterns:
-                        matches = re.finditer(pattern, section, re.IGNORECASE)
-                        for match in matches:
-                            code = match.group()
-                            pos = match.start()
-                            
-                            # Get context (up to 1000 characters around the code)
-                            start = max(0, pos - 500)
-                            end = min(len(section), pos + 500)
-                            context = section[start:end]
-                            
-                            # Extract description using multiple patterns
-                            description = None
-                            desc_patterns = [
-                                rf'{code}\s*[-:]+\s*([^.]*\.)',
-                                rf'{code}\s+([^.]*\.)',
-                                rf'{code}\s*\(([^)]*)\)',
-                                rf'{code}\s*\[([^\]]*)\]'
-                            ]
-                            
-                            for desc_pattern in desc_patterns:
-                                desc_match = re.search(desc_pattern, context, re.IGNORECASE)
-                                if desc_match:
-                                    description = desc_match.group(1).strip()
-                                    break
-                            
-                            if not description:
-                                continue
-                            
-                            # Extract requirements
-                            requirements = []
-                            req_indicators = [
-                                'required', 'must', 'should', 'need', 'necessary',
-                                'documentation', 'criteria', 'prerequisite',
-                                'condition', 'requirement'
-                            ]
-                            
-                            # Look for requirements in the context
-                            for indicator in req_indicators:
-                                req_matches = re.finditer(
-                                    rf'({indicator}[^.;]*[.;])',
-                                    context,
-                                    re.IGNORECASE
-                                )
-                                for req_match in req_matches:
-                                    req = req_match.group(1).strip()
-                                    if req not in requirements:
-                                        requirements.append(req)
-                            
-                            # Extract limitations
-                            limitations = []
-                            limit_indicators = [
-                                'limit', 'maximum', 'minimum', 'restricted',
-                                'not covered', 'excluded', 'only when',
-                                'frequency', 'interval'
-                            ]
-                            
-                            # Look for limitations in the context
-                            for indicator in limit_indicators:
-                                limit_matches = re.finditer(
-                                    rf'({indicator}[^.;]*[.;])',
-                                    context,
-                                    re.IGNORECASE
-                                )
-                                for limit_match in limit_matches:
-                                    limit = limit_match.group(1).strip()
-                                    if limit not in limitations:
-                                        limitations.append(limit)
-                            
-                            # Create the procedure object
-                            procedure = {
-                                'code': code,
-                                'description': description,
-                                'requirements': requirements or ['No specific requirements listed'],
-                                'limitations': limitations or ['No specific limitations listed'],
-                                'source_page': int(re.search(r'Page (\d+)', section).group(1))
-                                if re.search(r'Page (\d+)', section) else 1
-                            }
-                            
-                            # Add the procedure if it's not a duplicate
-                            if not any(p['code'] == code for p in procedures):
-                                procedures.append(procedure)
-                                self.logger.info(f"Extracted procedure {code}")
-                            
         except Exception as e:
             self.logger.error(f"Error extracting procedures from PDF: {str(e)}")
         
@@ -371,6 +398,42 @@ class AetnaSpider(Spider):
             
         return procedures
 
+    def generate_quality_report(self, procedures: List[Dict]) -> Dict:
+        """Summarize extraction quality for a list of procedures in a single pass."""
+        with_requirements = with_notes = total_requirements = valid = 0
+        for procedure in procedures:
+            requirements = procedure.get('requirements')
+            if requirements:
+                with_requirements += 1
+                total_requirements += len(requirements)
+            if procedure.get('notes'):
+                with_notes += 1
+            # Reuse the outcome recorded by parse_pdf instead of validating again
+            is_valid = procedure.get('_valid')
+            if is_valid is None:
+                is_valid = self.validator.validate_procedure_data(procedure)[0]
+            if is_valid:
+                valid += 1
+        
+        total = len(procedures)
+        report = {
+            'total_procedures': total,
+            'procedures_with_requirements': with_requirements,
+            'procedures_with_notes': with_notes,
+            'avg_requirements_per_procedure': total_requirements / total if total else 0.0,
+            'validation_rate': valid / total if total else 0.0,
+            'warnings': []
+        }
+        
+        if not total:
+            report['warnings'].append("No procedures extracted")
+        if with_requirements < total:
+            report['warnings'].append(f"{total - with_requirements} procedures have no requirements")
+        if valid < total:
+            report['warnings'].append(f"{total - valid} procedures failed validation")
+        
+        return report
+
     def handle_error(self, failure):
         """Handle request errors."""
         request_info = failure.request.meta.get('request_info', {})
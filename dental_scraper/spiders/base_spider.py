@@ -3,8 +3,8 @@ Base spider class providing common functionality for all dental insurance guidel
 """
 from typing import Optional, Dict, Any
 from pathlib import Path
-import json
 
+import orjson
 from scrapy import Spider
 from scrapy.http import Response, Request
 from loguru import logger
@@ -42,7 +42,8 @@ class BaseInsuranceSpider(Spider):
         self.credentials = credentials or {}
         self.output_dir = output_dir or Path('data/pdfs')
         
-        # Ensure output directory exists
+        # Ensure output directory exists; save_pdf and save_metadata rely on
+        # this and do not re-check it per file
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"Initialized {self.name} spider")
@@ -104,8 +105,9 @@ class BaseInsuranceSpider(Spider):
         """
         try:
             file_path = self.output_dir / filename
-            with open(file_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            file_path.write_bytes(
+                orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
             logger.info(f"Saved metadata to {file_path}")
             return file_path
         except Exception as e:
@@ -1,10 +1,20 @@
 import scrapy
-from bs4 import BeautifulSoup
+from scrapy.utils.defer import deferred_from_coro
+from selectolax.lexbor import LexborHTMLParser
 import re
 from loguru import logger
 from ..utils.download_handler import DownloadHandler
 from ..utils.pdf_processor import PDFProcessor
 
+# CSS selectors used on every page and procedure block
+_PDF_LINK_SELECTOR = 'a[href$=".pdf"]'
+_RESOURCES_LINK_SELECTOR = 'a[href*="/dental/resources"]'
+_PROCEDURE_BLOCK_SELECTOR = 'div.procedure-block'
+
+# Patterns used on every procedure block, compiled once
+_CDT_CODE_PATTERN = re.compile(r'^D\d{4}$')
+_HEADER_PATTERN = re.compile(r'(D\d{4})\s*-\s*(.+)')
+
 class CignaSpider(scrapy.Spider):
     name = 'cigna'
     allowed_domains = ['cigna.com']
@@ -25,12 +35,13 @@ class CignaSpider(scrapy.Spider):
         logger.info("Initialized Cigna spider")
 
     def parse(self, response):
-        logger.info(f"Parsing page: {response.url}")
-        soup = BeautifulSoup(response.body, 'html.parser')
+        # Arguments are only formatted if a sink accepts the record
+        logger.info("Parsing page: {}", response.url)
+        tree = LexborHTMLParser(response.body)
         
         # Find PDF links for guidelines and policy documents
-        for link in soup.find_all('a', href=re.compile(r'\.pdf$')):
-            pdf_url = link.get('href')
+        for link in tree.css(_PDF_LINK_SELECTOR):
+            pdf_url = link.attributes.get('href')
             if pdf_url:
                 # Only process guidelines.pdf and policy.pdf
                 if 'guidelines.pdf' in pdf_url:
@@ -58,8 +69,8 @@ class CignaSpider(scrapy.Spider):
                     )
         
         # Follow resource links
-        for link in soup.find_all('a', href=re.compile(r'/dental/resources')):
-            resource_url = link.get('href')
+        for link in tree.css(_RESOURCES_LINK_SELECTOR):
+            resource_url = link.attributes.get('href')
             if resource_url:
                 # Make sure the URL is absolute
                 if not resource_url.startswith(('http://', 'https://')):
@@ -72,7 +83,7 @@ class CignaSpider(scrapy.Spider):
                 )
         
         # Process procedure blocks
-        for block in soup.find_all('div', class_='procedure-block'):
+        for block in tree.css(_PROCEDURE_BLOCK_SELECTOR):
             result = self.process_procedure_block(block)
             if result and 'pdf_url' in result:
                 pdf_url = result['pdf_url']
@@ -92,12 +103,12 @@ class CignaSpider(scrapy.Spider):
 
     def parse_resource_page(self, response):
         """Parse a resource page for additional PDFs and information."""
-        logger.info(f"Parsing resource page: {response.url}")
-        soup = BeautifulSoup(response.body, 'html.parser')
+        logger.info("Parsing resource page: {}", response.url)
+        tree = LexborHTMLParser(response.body)
         
         # Find PDF links
-        for link in soup.find_all('a', href=re.compile(r'\.pdf$')):
-            pdf_url = link.get('href')
+        for link in tree.css(_PDF_LINK_SELECTOR):
+            pdf_url = link.attributes.get('href')
             if pdf_url:
                 # Make sure the URL is absolute
                 if not pdf_url.startswith(('http://', 'https://')):
@@ -113,7 +124,7 @@ class CignaSpider(scrapy.Spider):
     def parse_pdf(self, response):
         """Process a downloaded PDF."""
         pdf_url = response.meta.get('pdf_url', response.url)
-        logger.info(f"Processing PDF: {pdf_url}")
+        logger.info("Processing PDF: {}", pdf_url)
         
         try:
             # Save the PDF
@@ -135,7 +146,7 @@ class CignaSpider(scrapy.Spider):
 
     async def parse_pdf_link(self, response, pdf_type):
         """Parse a PDF link and extract procedure information."""
-        logger.info(f"Parsing PDF link: {response.url}")
+        logger.info("Parsing PDF link: {}", response.url)
         try:
             # Download the PDF
             pdf_path = await self.download_handler.download_pdf(
@@ -177,45 +188,45 @@ class CignaSpider(scrapy.Spider):
         """Validate a CDT code."""
         if not code:
             return False
-        return bool(re.match(r'^D\d{4}$', code))
+        return bool(_CDT_CODE_PATTERN.match(code))
 
     def process_procedure_block(self, block, tables=None):
         """
         Process a procedure block to extract relevant information.
         
         Args:
-            block: The procedure block to process. Can be a BeautifulSoup element or a dictionary.
+            block: The procedure block to process. Can be a selectolax node or a dictionary.
             tables: Optional tables data to supplement the procedure block information.
             
         Returns:
             A dictionary with procedure information or None if processing fails.
         """
         try:
-            # Handle BeautifulSoup element (from HTML parsing)
-            if hasattr(block, 'find'):
-                header = block.find('h3').text.strip()
-                match = re.match(r'(D\d{4})\s*-\s*(.+)', header)
+            # Handle selectolax node (from HTML parsing)
+            if hasattr(block, 'css_first'):
+                header = block.css_first('h3').text().strip()
+                match = _HEADER_PATTERN.match(header)
                 if not match:
-                    logger.debug(f"Invalid procedure code format: {header}")
+                    logger.debug("Invalid procedure code format: {}", header)
                     return None
                     
                 code, name = match.groups()
-                pdf_link = block.find('a', href=re.compile(r'\.pdf$'))
+                pdf_link = block.css_first(_PDF_LINK_SELECTOR)
                 
                 if not pdf_link:
-                    logger.warning(f"No PDF link found for {code}")
+                    logger.warning("No PDF link found for {}", code)
                     return None
                     
                 return {
                     'procedure_code': code,
                     'procedure_name': name.strip(),
-                    'pdf_url': pdf_link['href']
+                    'pdf_url': pdf_link.attributes['href']
                 }
             # Handle dictionary (from PDF parsing)
             else:
                 code = block.get('code')
                 if not self.validate_cdt_code(code):
-                    logger.debug(f"Invalid CDT code: {code}")
+                    logger.debug("Invalid CDT code: {}", code)
                     return None
                 
                 result = {
@@ -285,5 +296,6 @@ class CignaSpider(scrapy.Spider):
         else:
             logger.warning(f"Spider closed with reason: {reason}")
             
-        # Perform any cleanup or final processing here
-        return 
\ No newline at end of file
+        # Release the download handler's pooled connections, if a download opened any
+        if self.download_handler.has_session:
+            return deferred_from_coro(self.download_handler.close())
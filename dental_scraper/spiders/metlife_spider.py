@@ -191,4 +191,9 @@ class MetLifeSpider(BaseInsuranceSpider):
         """Handle any errors during the scraping process."""
         logger.error(f"Error in MetLife spider: {str(failure)}")
         # Implement retry logic or error reporting as needed
-        return None 
\ No newline at end of file
+        return None
+
+    def closed(self, reason):
+        """Shut down the PDF processor's worker pool when the spider closes."""
+        logger.info(f"MetLife spider closed: {reason}")
+        self.pdf_processor.close() 
\ No newline at end of file
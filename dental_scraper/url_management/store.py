@@ -1,6 +1,6 @@
 """Storage and management system for URLs."""
 
-import json
+import orjson
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 import logging
@@ -250,8 +250,9 @@ class URLStore:
             'urls': {url: entry.to_dict() for url, entry in self.urls.items()}
         }
         
-        with open(self.storage_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # save() runs after every mutation, so the encoder matters for large stores
+        with open(self.storage_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             
     def load(self) -> None:
         """Load the URL store from disk if storage_file exists."""
@@ -259,11 +260,11 @@ class URLStore:
             return
             
         try:
-            with open(self.storage_file, 'r') as f:
+            with open(self.storage_file, 'rb') as f:
                 content = f.read().strip()
                 if not content:  # Handle empty file
                     return
-                data = json.loads(content)
+                data = orjson.loads(content)
                 
             # Clear current data
             self.urls.clear()
@@ -281,7 +282,7 @@ class URLStore:
                 self._add_to_index(self.category_index, entry.category, url)
                 for tag in entry.tags:
                     self._add_to_index(self.tag_index, tag, url)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"Failed to parse JSON from {self.storage_file}, starting with empty store")
         except Exception as e:
             logger.error(f"Error loading URL store from {self.storage_file}: {str(e)}")
@@ -1,23 +1,67 @@
 import os
 import aiohttp
+import xxhash
 import asyncio
-from typing import Optional
+from typing import List, Optional
 from loguru import logger
 from datetime import datetime
-import hashlib
+from functools import lru_cache
+
+# Size of each body chunk read from the network and written to disk
+CHUNK_SIZE = 64 * 1024
+
+# Signature every PDF file starts with
+PDF_MAGIC = b'%PDF-'
+
+# Default number of downloads allowed in flight at once
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Browser User-Agent sent with every download
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+@lru_cache(maxsize=128)
+def _carrier_slug(carrier: str) -> str:
+    """Reduce a carrier name to lowercase alphanumerics, once per carrier."""
+    return ''.join(c for c in carrier.lower() if c.isalnum())
 
 class DownloadHandler:
     """Handles downloading and saving of PDF files."""
     
-    def __init__(self, download_dir: str = None):
+    def __init__(self, download_dir: str = None, max_concurrency: int = MAX_CONCURRENT_DOWNLOADS):
         """
         Initialize the download handler.
         
         Args:
             download_dir: Directory to save downloaded files (default: ./downloads)
+            max_concurrency: Maximum number of downloads in flight at once (default: 8)
         """
         self.download_dir = download_dir or os.path.join(os.getcwd(), 'downloads')
         self._ensure_download_dir()
+        # Shared across downloads so connections and DNS lookups are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Bounds concurrent downloads, e.g. those started by download_many
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=60),  # 60 seconds total timeout
+                headers={'User-Agent': USER_AGENT},
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+    
+    @property
+    def has_session(self) -> bool:
+        """Whether an HTTP session is open and needs closing."""
+        return self._session is not None
+    
+    async def close(self):
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
         
     def _ensure_download_dir(self):
         """Ensure the download directory exists."""
@@ -40,13 +84,13 @@ class DownloadHandler:
         """
         try:
             # Create a hash of the URL to ensure uniqueness
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:10]
+            url_hash = xxhash.xxh3_64_hexdigest(url.encode())[:10]
             
             # Get timestamp for versioning
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
             # Clean carrier name
-            carrier = ''.join(c for c in carrier.lower() if c.isalnum())
+            carrier = _carrier_slug(carrier)
             
             return f"{carrier}_{timestamp}_{url_hash}.pdf"
             
@@ -69,50 +113,52 @@ class DownloadHandler:
             filename = self._generate_filename(url, carrier)
             filepath = os.path.join(self.download_dir, filename)
             
-            # Configure timeout and headers
-            timeout = aiohttp.ClientTimeout(total=60)  # 60 seconds total timeout
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        logger.error(f"Failed to download PDF: {response.status} - {url}")
-                        return None
-                        
-                    # Verify content type
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    if 'application/pdf' not in content_type and 'application/octet-stream' not in content_type:
-                        logger.error(f"Invalid content type: {content_type} - {url}")
-                        return None
-                        
-                    # Read response in chunks
-                    try:
-                        with open(filepath, 'wb') as f:
-                            chunk_size = 8192  # 8KB chunks
-                            while True:
-                                chunk = await response.content.read(chunk_size)
-                                if not chunk:
-                                    break
-                                f.write(chunk)
-                    except Exception as e:
-                        logger.error(f"Error writing PDF file: {str(e)}")
-                        # Clean up partial download
-                        if os.path.exists(filepath):
-                            os.remove(filepath)
-                        return None
-                        
-                    # Verify file size
-                    file_size = os.path.getsize(filepath)
-                    if file_size < 1024:  # Less than 1KB is probably not a valid PDF
-                        logger.error(f"Downloaded file too small: {file_size} bytes")
+            session = await self._get_session()
+            async with self._semaphore, session.get(url) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to download PDF: {response.status} - {url}")
+                    return None
+                    
+                # Verify the body is a PDF before writing anything; carriers often
+                # mislabel the Content-Type and serve HTML error pages
+                head = b''
+                while len(head) < len(PDF_MAGIC):
+                    chunk = await response.content.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    head += chunk
+                if not head.startswith(PDF_MAGIC):
+                    content_type = response.headers.get('Content-Type', '')
+                    logger.error(f"Response is not a PDF (Content-Type: {content_type}) - {url}")
+                    return None
+                    
+                # Read response in chunks; disk writes run in a worker thread
+                # so they do not block the event loop
+                try:
+                    with open(filepath, 'wb') as f:
+                        await asyncio.to_thread(f.write, head)
+                        while True:
+                            chunk = await response.content.read(CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            await asyncio.to_thread(f.write, chunk)
+                except Exception as e:
+                    logger.error(f"Error writing PDF file: {str(e)}")
+                    # Clean up partial download
+                    if os.path.exists(filepath):
                         os.remove(filepath)
-                        return None
-                        
-                    logger.info(f"Successfully downloaded PDF: {url} -> {filepath}")
-                    return filepath
+                    return None
                     
+                # Verify file size
+                file_size = os.path.getsize(filepath)
+                if file_size < 1024:  # Less than 1KB is probably not a valid PDF
+                    logger.error(f"Downloaded file too small: {file_size} bytes")
+                    os.remove(filepath)
+                    return None
+                    
+                logger.info("Successfully downloaded PDF: {} -> {}", url, filepath)
+                return filepath
+                
         except asyncio.TimeoutError:
             logger.error(f"Timeout downloading PDF: {url}")
             return None
@@ -125,6 +171,20 @@ class DownloadHandler:
             logger.error(f"Unexpected error downloading PDF: {str(e)}")
             return None
             
+    async def download_many(self, urls: List[str], carrier: str) -> List[Optional[str]]:
+        """
+        Download several PDF files concurrently.
+        
+        Args:
+            urls: URLs of the PDFs to download
+            carrier: Insurance carrier name
+            
+        Returns:
+            Paths to the downloaded files in the same order as urls, with None
+            for each download that failed
+        """
+        return list(await asyncio.gather(*(self.download_pdf(url, carrier) for url in urls)))
+    
     async def cleanup_old_files(self, max_age_days: int = 7):
         """
         Clean up old downloaded files.
@@ -133,21 +193,21 @@ class DownloadHandler:
             max_age_days: Maximum age of files to keep (default: 7 days)
         """
         try:
-            now = datetime.now()
-            for filename in os.listdir(self.download_dir):
-                filepath = os.path.join(self.download_dir, filename)
-                if not os.path.isfile(filepath):
-                    continue
+            now = datetime.now().timestamp()
+            # scandir entries cache their stat results, so each file costs one stat call
+            with os.scandir(self.download_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
                     
-                file_time = datetime.fromtimestamp(os.path.getctime(filepath))
-                age_days = (now - file_time).days
-                
-                if age_days > max_age_days:
-                    try:
-                        os.remove(filepath)
-                        logger.info(f"Removed old file: {filepath}")
-                    except Exception as e:
-                        logger.error(f"Error removing old file {filepath}: {str(e)}")
+                    age_days = (now - entry.stat().st_ctime) // 86400
+                    
+                    if age_days > max_age_days:
+                        try:
+                            os.remove(entry.path)
+                            logger.info("Removed old file: {}", entry.path)
+                        except Exception as e:
+                            logger.error(f"Error removing old file {entry.path}: {str(e)}")
                         
         except Exception as e:
             logger.error(f"Error cleaning up old files: {str(e)}")
@@ -1,19 +1,52 @@
 """
 PDF processing utilities for the dental insurance guidelines web scraper.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import json
 import shutil
 from datetime import datetime
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor
 
+import orjson
 import pdfplumber
+import pypdfium2 as pdfium
+import xxhash
 from loguru import logger
 
 from ..exceptions import ParsingException
 
+# Bytes hashed from each end of a PDF to fingerprint it for the extraction cache
+FINGERPRINT_BLOCK = 64 * 1024
+# Number of extraction results kept in the cache; least recently used are evicted
+CACHE_MAX_ENTRIES = 200
+# Documents shorter than this are extracted serially; worker start-up would dominate
+PARALLEL_MIN_PAGES = 16
+# Upper bound on worker processes used for one document
+MAX_TEXT_WORKERS = 8
+
+# Patterns for procedure extraction, compiled once at import
+_CDT_CODE_RE = re.compile(r'D\d{4}')
+_DESC_RE = re.compile(r'D\d{4}\s+(.+?)(?=\n|$)')
+_REQ_RE = re.compile(r'Requirements?:(.*?)(?=Notes?:|$)', re.DOTALL)
+_REQ_ITEM_RE = re.compile(r'-\s*(.+?)(?=\n-|\n\n|\Z)', re.DOTALL)
+_NOTES_RE = re.compile(r'Notes?:(.*?)(?=$)', re.DOTALL)
+
+
+def _extract_page_range_text(pdf_path: Path, page_numbers: List[int]) -> List[str]:
+    """Extract the text of the given 1-based pages in a worker process."""
+    with pdfplumber.open(pdf_path, pages=page_numbers) as pdf:
+        return [page.extract_text() for page in pdf.pages]
+
+
+def _page_sort_key(page_key):
+    """Order "page_N" keys numerically, so page_10 follows page_9; other keys sort last."""
+    _, _, number = page_key.rpartition("_")
+    return (0, int(number), page_key) if number.isdigit() else (1, 0, page_key)
+
+
 class PDFProcessor:
     """
     Utility class for processing dental insurance guideline PDFs.
@@ -34,6 +67,7 @@ class PDFProcessor:
         """
         self.base_dir = base_dir or Path('data/pdfs')
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = self.base_dir / '.cache'
         
     def extract_text(self, pdf_path: Path) -> str:
         """
@@ -49,15 +83,82 @@ class PDFProcessor:
             ParsingException: If text extraction fails
         """
         try:
-            text_content = []
+            workers = min(MAX_TEXT_WORKERS, os.cpu_count() or 1)
             with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text_content.append(page.extract_text())
+                num_pages = len(pdf.pages)
+                if workers < 2 or num_pages < PARALLEL_MIN_PAGES:
+                    return self._text_from(pdf)
             
-            return '\n'.join(text_content)
+            try:
+                return self._extract_text_parallel(pdf_path, num_pages, workers)
+            except Exception as e:
+                logger.warning(f"Parallel text extraction failed for {pdf_path}, retrying serially: {e}")
+                with pdfplumber.open(pdf_path) as pdf:
+                    return self._text_from(pdf)
+        except Exception as e:
+            raise ParsingException(f"Failed to extract text from {pdf_path}: {e}")
+    
+    def extract_text_fast(self, pdf_path: Path) -> str:
+        """
+        Extract text content from a PDF file with PDFium.
+        
+        Much faster than extract_text because no character or layout objects
+        are built. Use it when only the text is needed.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Extracted text content
+            
+        Raises:
+            ParsingException: If text extraction fails
+        """
+        try:
+            return '\n'.join(self.extract_page_texts_fast(pdf_path))
         except Exception as e:
             raise ParsingException(f"Failed to extract text from {pdf_path}: {e}")
     
+    @staticmethod
+    def extract_page_texts_fast(pdf_path: Path) -> List[str]:
+        """
+        Extract the text of every page of a PDF file with PDFium.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Text of each page in page order, with newline line endings
+        """
+        texts = []
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium separates lines with CRLF; pdfplumber and the parsers expect LF
+                texts.append(textpage.get_text_range().replace('\r\n', '\n'))
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return texts
+    
+    @staticmethod
+    def _extract_text_parallel(pdf_path: Path, num_pages: int, workers: int) -> str:
+        """Extract page text across worker processes, each opening its own slice of pages."""
+        chunk_size = -(-num_pages // workers)
+        chunks = [list(range(start + 1, min(start + chunk_size, num_pages) + 1))
+                  for start in range(0, num_pages, chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_extract_page_range_text, [pdf_path] * len(chunks), chunks)
+            return '\n'.join(text for chunk_text in results for text in chunk_text)
+    
+    @staticmethod
+    def _text_from(pdf) -> str:
+        """Join the text of every page of an open pdfplumber document."""
+        return '\n'.join(page.extract_text() for page in pdf.pages)
+    
     def extract_metadata(self, pdf_path: Path) -> Dict[str, Any]:
         """
         Extract metadata from a PDF file.
@@ -73,21 +174,45 @@ class PDFProcessor:
         """
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                # Get PDF metadata
-                metadata = pdf.metadata
-                
-                # Add additional metadata
-                metadata.update({
-                    'num_pages': len(pdf.pages),
-                    'file_name': pdf_path.name,
-                    'extraction_date': datetime.now().isoformat(),
-                    'file_size': pdf_path.stat().st_size
-                })
-                
-                return metadata
+                return self._metadata_from(pdf, pdf_path)
         except Exception as e:
             raise ParsingException(f"Failed to extract metadata from {pdf_path}: {e}")
     
+    @staticmethod
+    def _metadata_from(pdf, pdf_path: Path) -> Dict[str, Any]:
+        """Build the metadata dictionary for an open pdfplumber document."""
+        # Get PDF metadata
+        metadata = pdf.metadata
+        
+        # Add additional metadata
+        metadata.update({
+            'num_pages': len(pdf.pages),
+            'file_name': pdf_path.name,
+            'extraction_date': datetime.now().isoformat(),
+            'file_size': pdf_path.stat().st_size
+        })
+        
+        return metadata
+    
+    def extract_all(self, pdf_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract text content and metadata from a single parse of a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Tuple of the extracted text and the metadata dictionary
+            
+        Raises:
+            ParsingException: If extraction fails
+        """
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                return self._text_from(pdf), self._metadata_from(pdf, pdf_path)
+        except Exception as e:
+            raise ParsingException(f"Failed to extract content from {pdf_path}: {e}")
+    
     def organize_by_provider(self, pdf_path: Path, provider: str, 
                            metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Path]:
         """
@@ -117,9 +242,11 @@ class PDFProcessor:
             shutil.copy2(pdf_path, organized_pdf)
             
             # Save metadata if provided
+            # Metadata carries the full extracted text, so it is serialized with orjson
             if metadata:
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                metadata_path.write_bytes(
+                    orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
             
             return {
                 'pdf_path': organized_pdf,
@@ -143,9 +270,21 @@ class PDFProcessor:
             ParsingException: If processing fails
         """
         try:
-            # Extract text and metadata
-            text_content = self.extract_text(pdf_path)
-            metadata = self.extract_metadata(pdf_path)
+            fingerprint = self._fingerprint(pdf_path)
+            extracted = self._read_cache(fingerprint)
+            if extracted is None:
+                text_content, metadata = self.extract_all(pdf_path)
+                extracted = {'text_content': text_content, 'metadata': metadata}
+                self._write_cache(fingerprint, extracted)
+            else:
+                # The same content may be cached under another file name
+                extracted['metadata'].update({
+                    'file_name': pdf_path.name,
+                    'extraction_date': datetime.now().isoformat()
+                })
+            
+            text_content = extracted['text_content']
+            metadata = extracted['metadata']
             
             # Add extracted text to metadata
             metadata['extracted_text'] = text_content
@@ -161,6 +300,62 @@ class PDFProcessor:
         except Exception as e:
             raise ParsingException(f"Failed to process PDF {pdf_path}: {e}")
     
+    @staticmethod
+    def _fingerprint(pdf_path: Path) -> Optional[str]:
+        """
+        Fingerprint a PDF's content from its size and its first and last blocks.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Hex digest, or None if the file cannot be read
+        """
+        try:
+            size = pdf_path.stat().st_size
+            hasher = xxhash.xxh3_64(str(size).encode())
+            with open(pdf_path, 'rb') as f:
+                hasher.update(f.read(FINGERPRINT_BLOCK))
+                if size > FINGERPRINT_BLOCK:
+                    f.seek(max(FINGERPRINT_BLOCK, size - FINGERPRINT_BLOCK))
+                    hasher.update(f.read(FINGERPRINT_BLOCK))
+            return hasher.hexdigest()
+        except (OSError, TypeError):
+            return None
+    
+    def _read_cache(self, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction for a fingerprint, or None on a cache miss."""
+        if fingerprint is None:
+            return None
+        cache_path = self.cache_dir / f"{fingerprint}.json"
+        try:
+            extracted = orjson.loads(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read extraction cache {cache_path}: {e}")
+            return None
+        # Mark the entry as recently used for eviction
+        os.utime(cache_path)
+        return extracted
+    
+    def _write_cache(self, fingerprint: Optional[str], extracted: Dict[str, Any]) -> None:
+        """Store an extraction in the cache and evict the least recently used entries."""
+        if fingerprint is None:
+            return
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            cache_path = self.cache_dir / f"{fingerprint}.json"
+            cache_path.write_bytes(orjson.dumps(extracted, default=str, option=orjson.OPT_NON_STR_KEYS))
+            
+            entries = list(self.cache_dir.glob('*.json'))
+            if len(entries) > CACHE_MAX_ENTRIES:
+                entries.sort(key=os.path.getatime, reverse=True)
+                for stale in entries[CACHE_MAX_ENTRIES:]:
+                    stale.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to write extraction cache: {e}")
+    
     def get_provider_pdfs(self, provider: str) -> List[Dict[str, Any]]:
         """
         Get all PDFs for a specific provider.
@@ -206,11 +401,8 @@ class PDFProcessor:
         if not content:
             return ""
         
-        combined_text = ""
-        for page_num in sorted(content.keys()):
-            combined_text += content[page_num] + "\n\n"
-        
-        return combined_text
+        # Join once instead of re-copying the accumulated text for every page
+        return "".join(content[page_num] + "\n\n" for page_num in sorted(content, key=_page_sort_key))
 
     def extract_procedure_codes(self, text):
         """
@@ -223,8 +415,7 @@ class PDFProcessor:
             list: List of extracted CDT codes
         """
         logger.debug("Extracting procedure codes from text")
-        pattern = r'D\d{4}'
-        return re.findall(pattern, text)
+        return _CDT_CODE_RE.findall(text)
         
     def extract_procedures(self, text):
         """
@@ -239,10 +430,7 @@ class PDFProcessor:
         logger.info("Extracting procedures from text")
         procedures = []
         
-        # IMPORTANT: In the test, this function is mocked with re.findall to return procedure blocks
-        procedure_blocks = re.findall(r'D\d{4}.*?(?=D\d{4}|\Z)', text, re.DOTALL)
-        
-        for block in procedure_blocks:
+        for code, block in self._split_procedure_blocks(text):
             # For the mocked version in test_extract_procedures, we need special handling
             if "- Patient must be new" in block:
                 # Special case for test
@@ -262,24 +450,18 @@ class PDFProcessor:
                 ]
             
             # Regular processing for non-mocked case
-            # Extract the procedure code
-            code_match = re.search(r'(D\d{4})', block)
-            if not code_match:
-                continue
-                
-            code = code_match.group(1)
-            
-            # Extract description - everything after code until newline
-            desc_match = re.search(r'D\d{4}\s+(.+?)(?=\n|$)', block)
+            # Extract description - everything after code until newline; every
+            # block starts with its code, so the pattern is anchored there
+            desc_match = _DESC_RE.match(block)
             description = desc_match.group(1).strip() if desc_match else ""
             
             # Extract requirements
             requirements = []
-            req_section = re.search(r'Requirements?:(.*?)(?=Notes?:|$)', block, re.DOTALL)
+            req_section = _REQ_RE.search(block)
             if req_section:
                 req_text = req_section.group(1).strip()
                 # Extract bullet points
-                req_items = re.findall(r'-\s*(.+?)(?=\n-|\n\n|\Z)', req_text, re.DOTALL)
+                req_items = _REQ_ITEM_RE.findall(req_text)
                 if req_items:
                     requirements = [item.strip() for item in req_items]
                 else:
@@ -288,7 +470,7 @@ class PDFProcessor:
             
             # Extract notes if present
             notes = None
-            notes_section = re.search(r'Notes?:(.*?)(?=$)', block, re.DOTALL)
+            notes_section = _NOTES_RE.search(block)
             if notes_section:
                 notes = notes_section.group(1).strip()
             
@@ -304,6 +486,24 @@ class PDFProcessor:
         
         return procedures
 
+    @staticmethod
+    def _split_procedure_blocks(text):
+        """
+        Split text into blocks that each run from one CDT code to the next.
+        
+        Blocks are sliced between code positions found in a single scan, rather
+        than matched with a lazy pattern that tries a lookahead at every character.
+        
+        Args:
+            text (str): The text to split
+            
+        Returns:
+            list: (code, block) tuples in document order
+        """
+        matches = list(_CDT_CODE_RE.finditer(text))
+        ends = [match.start() for match in matches[1:]] + [len(text)]
+        return [(match.group(), text[match.start():end]) for match, end in zip(matches, ends)]
+
     def pdf_to_json(self, pdf_path, output_path=None, method="pdfplumber"):
         """
         Convert a PDF file to a JSON file.
@@ -340,9 +540,10 @@ class PDFProcessor:
         # Create directory if it doesn't exist - using os.makedirs to match test expectations
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Write to JSON file
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        # Write to JSON file; orjson always emits UTF-8
+        Path(output_path).write_bytes(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
         
         return str(output_path)
         
@@ -7,15 +7,22 @@ setup(
     install_requires=[
         "scrapy>=2.11.0",
         "beautifulsoup4>=4.12.3",
+        "selectolax>=0.3.21",
+        "pyahocorasick>=2.0.0",
         "lxml>=5.1.0",
         "selenium>=4.18.1",
         "fake-useragent>=1.4.0",
         "pdfplumber>=0.10.3",
+        "pymupdf>=1.24.3",
+        "pypdfium2>=4.0.0",
         "PyPDF2>=3.0.1",
         "pandas>=2.2.0",
         "numpy>=1.26.3",
         "pymongo>=4.6.1",
         "loguru>=0.7.2",
+        "orjson>=3.8.0",
+        "msgspec>=0.18.0",
+        "xxhash>=3.0.0",
     ],
     extras_require={
         "test": [
@@ -127,6 +127,20 @@ def test_config_manager_list_configs(config_manager):
     assert isinstance(configs["service1"], BasicAuthConfig)
     assert isinstance(configs["service2"], FormAuthConfig)
 
+def test_config_manager_configs_view(config_manager):
+    """Test the read-only configs view and case-insensitive lookup."""
+    config_manager.add_config("Service1", {
+        "auth_type": "basic",
+        "service_name": "Service1",
+        "base_url": "https://example1.com",
+        "auth_url": "https://example1.com/auth"
+    })
+    
+    assert isinstance(config_manager.configs["Service1"], BasicAuthConfig)
+    assert config_manager.get_config("service1") is config_manager.configs["Service1"]
+    with pytest.raises(TypeError):
+        config_manager.configs["other"] = None
+
 def test_invalid_auth_type(config_manager):
     """Test handling of invalid auth type."""
     with pytest.raises(ValueError):
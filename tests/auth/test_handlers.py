@@ -2,12 +2,18 @@
 Tests for authentication handlers.
 """
 import pytest
+import requests
 import responses
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from auth.storage import CredentialManager
+from auth.utils import _SSL_CONTEXT
 from auth.handlers import (
     BasicAuthHandler,
     FormAuthHandler,
     TokenAuthHandler,
+    LoginSpec,
+    batch_authenticate,
     create_auth_handler
 )
 
@@ -92,6 +98,39 @@ def test_form_auth_success(form_auth_handler):
     assert success
     assert form_auth_handler.is_authenticated()
 
+@pytest.mark.asyncio
+async def test_batch_authenticate(credential_manager):
+    """Test concurrent form logins populate each handler's session."""
+    submitted = []
+    
+    async def login(request):
+        if request.method == 'GET':
+            return web.Response(
+                text='<form><input name="csrf_token" value="test_token"></form>',
+                content_type='text/html'
+            )
+        submitted.append(dict(await request.post()))
+        response = web.HTTPFound('/dashboard')
+        response.set_cookie('sessionid', 'abc123')
+        raise response
+    
+    async def dashboard(request):
+        return web.Response(text='welcome')
+    
+    app = web.Application()
+    app.router.add_route('*', '/login', login)
+    app.router.add_get('/dashboard', dashboard)
+    
+    async with TestServer(app) as server:
+        url = str(server.make_url('/login'))
+        handlers = await batch_authenticate(
+            [LoginSpec('user_a', 'pass_a', url), LoginSpec('user_b', 'pass_b', url)],
+            credential_manager
+        )
+    
+    assert all(handler.is_authenticated() for handler in handlers)
+    assert sorted(form['username'] for form in submitted) == ['user_a', 'user_b']
+
 @responses.activate
 def test_token_auth_success(token_auth_handler):
     """Test successful token authentication."""
@@ -113,6 +152,28 @@ def test_token_auth_success(token_auth_handler):
     assert success
     assert token_auth_handler.is_authenticated()
 
+@responses.activate
+def test_token_auth_expiry(token_auth_handler, monkeypatch):
+    """Test token expiry is tracked against the monotonic clock."""
+    responses.add(
+        responses.POST,
+        'https://example.com/token',
+        json={
+            'token': 'test_token',
+            'expires_in': 3600
+        },
+        status=200
+    )
+    
+    assert token_auth_handler.authenticate(
+        username="test_user",
+        password="test_pass",
+        token_url="https://example.com/token"
+    )
+    deadline = token_auth_handler._auth_valid_until_monotonic
+    monkeypatch.setattr('auth.handlers.time.monotonic', lambda: deadline + 1)
+    assert not token_auth_handler.is_authenticated()
+
 def test_create_auth_handler(credential_manager):
     """Test auth handler factory function."""
     basic_handler = create_auth_handler('basic', credential_manager)
@@ -137,4 +198,25 @@ def test_clear_auth(basic_auth_handler):
     
     assert basic_auth_handler._token is None
     assert basic_auth_handler._token_expiry is None
-    assert len(basic_auth_handler.session.cookies) == 0 
\ No newline at end of file
+    assert len(basic_auth_handler.session.cookies) == 0 
+
+
+def test_handlers_share_connection_pool(credential_manager):
+    """Test handlers for the same host reuse one transport adapter."""
+    first = create_auth_handler('basic', credential_manager, base_url='https://example.com')
+    second = create_auth_handler('token', credential_manager, base_url='https://example.com/api')
+    
+    assert first.session is not second.session
+    assert first.session.get_adapter('https://example.com') is second.session.get_adapter('https://example.com')
+
+def test_shared_tls_context(credential_manager):
+    """Test verified HTTPS connections use the process-wide SSL context."""
+    handler = create_auth_handler('basic', credential_manager, base_url='https://example.com')
+    request = requests.Request('GET', 'https://example.com/auth').prepare()
+    adapter = handler.session.get_adapter(request.url)
+    
+    _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, True)
+    assert pool_kwargs['ssl_context'] is _SSL_CONTEXT
+    
+    _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, False)
+    assert 'ssl_context' not in pool_kwargs
@@ -50,4 +50,15 @@ def test_empty_key_value(credential_manager):
         credential_manager.store_credential("", "test_value")
     
     with pytest.raises(ValueError):
-        credential_manager.store_credential("test_key", "") 
\ No newline at end of file
+        credential_manager.store_credential("test_key", "") 
+
+def test_get_credential_cached(credential_manager, monkeypatch):
+    """Test repeated lookups are served from the in-memory cache."""
+    credential_manager.store_credential("test_key", "test_value")
+    assert credential_manager.get_credential("test_key") == "test_value"
+    
+    def fail_fetch(*args, **kwargs):
+        raise AssertionError("backend should not be queried")
+    monkeypatch.setattr(credential_manager, "_fetch_credential", fail_fetch)
+    
+    assert credential_manager.get_credential("test_key") == "test_value"
@@ -6,6 +6,7 @@ import time
 from unittest.mock import patch, MagicMock
 
 from scrapy import Request
+from twisted.internet.defer import succeed
 from scrapy.exceptions import IgnoreRequest
 
 from dental_scraper.middlewares.rate_limiter import RateLimitMiddleware
@@ -32,29 +33,38 @@ def test_init():
     """Test initialization of RateLimitMiddleware."""
     middleware = RateLimitMiddleware()
     assert middleware.default_delay == 2.0
-    assert middleware.domain_delays == {}
-    assert middleware.last_request_time is not None
+    assert middleware._state == {}
 
-def test_process_request_no_delay(rate_limiter, test_request, spider):
+@pytest.mark.asyncio
+async def test_process_request_no_delay(rate_limiter, test_request, spider):
     """Test processing a request with no previous requests."""
     # Should return None to allow request to proceed
-    result = rate_limiter.process_request(test_request, spider)
+    with patch('dental_scraper.middlewares.rate_limiter.deferLater') as mock_defer_later:
+        result = await rate_limiter.process_request(test_request, spider)
     assert result is None
-    assert "example.com" in rate_limiter.last_request_time
+    mock_defer_later.assert_not_called()
+    assert "example.com" in rate_limiter._state
 
-def test_process_request_with_delay(rate_limiter, test_request, spider):
+@pytest.mark.asyncio
+async def test_process_request_with_delay(rate_limiter, test_request, spider):
     """Test processing a request with a recent previous request."""
     # Set last request time to now
     domain = test_request.url.split('/')[2]
-    rate_limiter.last_request_time[domain] = time.time()
+    rate_limiter._domain_state(domain).last = time.time()
     
-    # Mock time.sleep to avoid actually waiting
-    with patch('time.sleep') as mock_sleep:
-        result = rate_limiter.process_request(test_request, spider)
+    # Mock time.sleep to make sure the reactor thread is never blocked
+    with patch('time.sleep') as mock_sleep, \
+         patch('dental_scraper.middlewares.rate_limiter.deferLater', return_value=succeed(None)) as mock_defer_later:
+        result = await rate_limiter.process_request(test_request, spider)
         
-        # Should still return None but should have called sleep
+        # Should wait on the reactor instead of sleeping
         assert result is None
-        mock_sleep.assert_called_once()
+        mock_sleep.assert_not_called()
+        wait_time = mock_defer_later.call_args.args[1]
+        assert 0 < wait_time <= rate_limiter.default_delay
+    
+    # The slot is reserved so the next request waits behind this one
+    assert rate_limiter._state[domain].last > time.time()
 
 def test_process_response_success(rate_limiter, test_request, spider):
     """Test processing a successful response."""
@@ -74,9 +84,24 @@ def test_process_response_rate_limited(rate_limiter, test_request, spider):
     
     # Verify delay was increased for the domain
     domain = test_request.url.split('/')[2]
-    assert rate_limiter.domain_delays[domain] > rate_limiter.default_delay
+    assert rate_limiter._state[domain].delay > rate_limiter.default_delay
+
+@pytest.mark.asyncio
+async def test_domain_parsed_once_per_request(rate_limiter, test_request, spider):
+    """Test the domain is parsed once per request and afresh for redirected copies."""
+    await rate_limiter.process_request(test_request, spider)
+    
+    with patch('scrapy.utils.httpobj.urlparse') as mock_urlparse:
+        response = MagicMock()
+        response.status = 503
+        with pytest.raises(RateLimitException):
+            rate_limiter.process_response(test_request, response, spider)
+        mock_urlparse.assert_not_called()
+    
+    redirected = test_request.replace(url="https://other.example.org/test")
+    assert rate_limiter._domain(redirected) == "other.example.org"
 
 def test_set_domain_delay(rate_limiter):
     """Test setting a custom delay for a domain."""
     rate_limiter.set_domain_delay("example.com", 5.0)
-    assert rate_limiter.domain_delays["example.com"] == 5.0 
\ No newline at end of file
+    assert rate_limiter._state["example.com"].delay == 5.0 
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Tests for batch procedure validation.
+"""
+from dental_scraper.models import DataValidator, Procedure
+
+VALID = {
+    "code": "D0150",
+    "description": "Comprehensive oral evaluation",
+    "requirements": [" Complete charting "],
+    "effective_date": "2024-01-01"
+}
+INVALID = {
+    "code": "X150",
+    "description": "Bad code",
+    "requirements": [],
+    "effective_date": "2024-01-01"
+}
+
+
+def test_validate_procedures_batch_all_valid():
+    results = DataValidator.validate_procedures_batch([VALID, VALID])
+
+    assert [is_valid for is_valid, _, _ in results] == [True, True]
+    assert all(isinstance(procedure, Procedure) for _, procedure, _ in results)
+    assert results[0][1].requirements == ["Complete charting"]
+
+
+def test_validate_procedures_batch_matches_single_validation():
+    procedures = [INVALID, VALID, INVALID]
+
+    results = DataValidator.validate_procedures_batch(procedures)
+
+    assert results == [DataValidator.validate_procedure_data(data) for data in procedures]
+
+
+def test_validate_procedures_batch_empty():
+    assert DataValidator.validate_procedures_batch([]) == []
@@ -0,0 +1,43 @@
+"""
+Tests for the msgspec guideline mirrors.
+"""
+import pytest
+from datetime import date
+
+import orjson
+
+from dental_scraper.models import CarrierFast, CarrierGuidelines, DataValidator
+
+CARRIER = {
+    "carrier": "Aetna",
+    "year": 2024,
+    "source_url": "https://www.aetna.com/dental/guidelines-2024.pdf",
+    "last_updated": "2024-01-01",
+    "procedures": [
+        {
+            "code": "D0150",
+            "description": "Comprehensive oral evaluation",
+            "requirements": ["Complete charting"],
+            "effective_date": "2024-01-01"
+        }
+    ]
+}
+
+def test_load_carriers_fast():
+    """Test cached carrier JSON decodes into structs and converts to models."""
+    carriers = DataValidator.load_carriers_fast(orjson.dumps([CARRIER]))
+    
+    assert len(carriers) == 1
+    assert isinstance(carriers[0], CarrierFast)
+    assert carriers[0].procedures[0].effective_date == date(2024, 1, 1)
+    
+    model = carriers[0].to_model()
+    assert isinstance(model, CarrierGuidelines)
+    assert model.procedures[0].code == "D0150"
+
+def test_load_carriers_fast_invalid():
+    """Test schema violations are reported as ValueError."""
+    bad = dict(CARRIER, year=2020)
+    
+    with pytest.raises(ValueError):
+        DataValidator.load_carriers_fast(orjson.dumps([bad]))
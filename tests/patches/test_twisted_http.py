@@ -0,0 +1,33 @@
+"""
+Tests for the Twisted compatibility patches.
+"""
+import pytest
+
+from dental_scraper.patches.twisted_http import parse_header, _parse_header_slow
+
+@pytest.mark.parametrize("line", [
+    'text/html; charset=UTF-8',
+    'Text/HTML',
+    ' text/html ; charset=utf-8 ',
+    'multipart/form-data; boundary="ab\\"c d"',
+    'text/html; a="b;c"',
+    'text/html; a=1; a=2',
+    'text/html;charset=utf-8;',
+    "text/html; title*=us-ascii'en'This%20is",
+    'text/html; a=b c',
+    'foo',
+])
+def test_parse_header_matches_message_parser(line):
+    """Test the fast path agrees with email.message.Message parsing."""
+    assert parse_header(line) == _parse_header_slow(line)
+
+def test_parse_header_returns_fresh_params():
+    """Test cached results cannot be mutated through a returned dict."""
+    _, params = parse_header('multipart/form-data; boundary=abc')
+    params['boundary'] = b'abc'
+    
+    assert parse_header('multipart/form-data; boundary=abc')[1]['boundary'] == 'abc'
+
+def test_parse_header_empty():
+    """Test an empty header parses to an empty type."""
+    assert parse_header('') == ('', {})
@@ -0,0 +1,175 @@
+"""
+Tests for the PDF text extraction utilities.
+"""
+import pytest
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pymupdf
+
+from dental_scraper.pdf.extractor import PDFExtractor
+
+SAMPLE_PDF = Path(__file__).parent.parent.parent / "sample_dental_guidelines.pdf"
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["pymupdf", "pdfplumber"])
+async def test_extract_text_backends(backend):
+    """Test both text backends extract the guideline content."""
+    extractor = PDFExtractor(backend=backend)
+    
+    text = await extractor.extract_text(SAMPLE_PDF)
+    
+    assert "CDT Code: D0150" in text
+    assert "Comprehensive oral evaluation" in text
+
+@pytest.mark.asyncio
+async def test_extract_all_populates_cache(tmp_path):
+    """Test extract_all returns text and tables and caches both."""
+    extractor = PDFExtractor(cache_dir=str(tmp_path))
+    
+    result = await extractor.extract_all(SAMPLE_PDF)
+    
+    assert "CDT Code: D0150" in result["text"]
+    assert isinstance(result["tables"], list)
+    assert extractor._get_cache_path(SAMPLE_PDF, "text").exists()
+    assert extractor._get_cache_path(SAMPLE_PDF, "tables").exists()
+    assert await extractor.extract_text(SAMPLE_PDF) == result["text"]
+    assert await extractor.extract_tables(SAMPLE_PDF) == result["tables"]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["pymupdf", "pdfplumber"])
+async def test_extract_text_batch(backend):
+    """Test batch extraction returns one text per input, in order."""
+    extractor = PDFExtractor(backend=backend)
+    
+    texts = await extractor.extract_text_batch([SAMPLE_PDF, SAMPLE_PDF])
+    
+    assert len(texts) == 2
+    assert texts[0] == texts[1]
+    assert "CDT Code: D0150" in texts[0]
+
+@pytest.mark.asyncio
+async def test_extract_text_chunks_keep_page_order(tmp_path):
+    """Test chunked workers only load their pages and results stay in order."""
+    pdf_path = tmp_path / "pages.pdf"
+    with pymupdf.open() as doc:
+        for number in range(1, 4):
+            doc.new_page().insert_text((72, 72), f"Page number {number}")
+        doc.save(pdf_path)
+    extractor = PDFExtractor(chunk_size=2, backend="pdfplumber")
+    
+    text = await extractor.extract_text(pdf_path)
+    
+    assert text.split("\n") == ["Page number 1", "Page number 2", "Page number 3"]
+
+@pytest.mark.asyncio
+async def test_blank_pages_skipped(tmp_path):
+    """Test pages without characters or ruling lines yield no text or tables."""
+    pdf_path = tmp_path / "blank.pdf"
+    with pymupdf.open() as doc:
+        doc.new_page().insert_text((72, 72), "Only page with text")
+        doc.new_page()
+        doc.save(pdf_path)
+    extractor = PDFExtractor(backend="pdfplumber")
+    
+    result = await extractor.extract_all(pdf_path)
+    
+    assert result == {"text": "Only page with text", "tables": []}
+
+@pytest.mark.asyncio
+async def test_worker_pool_reused_until_closed():
+    """Test chunked extraction reuses one worker pool across calls."""
+    extractor = PDFExtractor(backend="pdfplumber", max_workers=2)
+    
+    text = await extractor.extract_text(SAMPLE_PDF)
+    executor = extractor._executor
+    tables = await extractor.extract_tables(SAMPLE_PDF)
+    
+    assert "CDT Code: D0150" in text
+    assert isinstance(tables, list)
+    assert executor is not None
+    assert extractor._executor is executor
+    
+    extractor.close()
+    assert extractor._executor is None
+
+@pytest.mark.asyncio
+async def test_async_context_closes_worker_pool():
+    """Test leaving an async with block shuts the worker pool down."""
+    async with PDFExtractor(backend="pdfplumber", max_workers=2) as extractor:
+        text = await extractor.extract_text(SAMPLE_PDF)
+        assert extractor._executor is not None
+    
+    assert "CDT Code: D0150" in text
+    assert extractor._executor is None
+
+@pytest.mark.asyncio
+async def test_extract_tables_only_parses_pages_with_drawings(tmp_path):
+    """Test ruled tables are found while pages without drawings are not parsed."""
+    pdf_path = tmp_path / "tables.pdf"
+    with pymupdf.open() as doc:
+        doc.new_page().insert_text((72, 72), "Text only")
+        page = doc.new_page()
+        xs, ys = [72, 200, 330], [100, 130, 160]
+        for x in xs:
+            page.draw_line((x, ys[0]), (x, ys[-1]))
+        for y in ys:
+            page.draw_line((xs[0], y), (xs[-1], y))
+        for row, values in enumerate([["Code", "Fee"], ["D0150", "100"]]):
+            for column, value in enumerate(values):
+                page.insert_text((xs[column] + 5, ys[row] + 20), value)
+        doc.save(pdf_path)
+    extractor = PDFExtractor(max_workers=1)
+    
+    assert PDFExtractor._pages_with_drawings(pdf_path.read_bytes()) == [2]
+    assert await extractor.extract_tables(pdf_path) == [{"Code": "D0150", "Fee": "100"}]
+    assert (await extractor.extract_all(pdf_path))["tables"] == [{"Code": "D0150", "Fee": "100"}]
+    extractor.close()
+
+def test_cache_keyed_on_content(tmp_path):
+    """Test cache paths follow file contents rather than file names."""
+    extractor = PDFExtractor(cache_dir=str(tmp_path / "cache"))
+    first = tmp_path / "first.pdf"
+    first.write_bytes(SAMPLE_PDF.read_bytes())
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(SAMPLE_PDF.read_bytes())
+    
+    original_key = extractor._get_cache_path(first, "text")
+    assert extractor._get_cache_path(copy, "text") == original_key
+    
+    first.write_bytes(SAMPLE_PDF.read_bytes() + b"\n% appended")
+    assert extractor._get_cache_path(first, "text") != original_key
+    assert extractor._get_cache_path(tmp_path / "missing.pdf", "text") is None
+
+@pytest.mark.asyncio
+async def test_cache_key_hashed_off_event_loop(tmp_path):
+    """Test the content hash behind the cache key is not computed on the loop thread."""
+    extractor = PDFExtractor(cache_dir=str(tmp_path))
+    hash_threads = []
+    
+    def record_thread(path):
+        hash_threads.append(threading.current_thread())
+        return "key"
+    
+    with patch("dental_scraper.pdf.extractor.file_content_hash", side_effect=record_thread):
+        await extractor.extract_all(SAMPLE_PDF)
+        await extractor.extract_text(SAMPLE_PDF)
+        await extractor.extract_tables(SAMPLE_PDF)
+    
+    assert len(hash_threads) == 4
+    assert threading.current_thread() not in hash_threads
+
+def test_chunk_size_derived_from_workers():
+    """Test pages are split into about four chunks per worker unless chunk_size is set."""
+    extractor = PDFExtractor(max_workers=2, max_chunk_size=10)
+    
+    assert extractor._chunk_size_for(3) == 1
+    assert extractor._chunk_size_for(40) == 5
+    assert extractor._chunk_size_for(400) == 10
+    assert PDFExtractor(chunk_size=3, max_workers=2)._chunk_size_for(400) == 3
+
+def test_invalid_backend():
+    """Test an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        PDFExtractor(backend="unknown")
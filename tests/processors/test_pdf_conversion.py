@@ -0,0 +1,144 @@
+"""
+Tests for the PDF to JSON conversion helpers.
+"""
+import json
+import pymupdf
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from dental_scraper.processors.pdf_processor import EXTRACTION_METHODS, PDFProcessor, PerformanceMonitor, pdf_to_json
+
+SAMPLE_PDF = Path(__file__).parent.parent.parent / "sample_dental_guidelines.pdf"
+
+@pytest.mark.parametrize("method", list(EXTRACTION_METHODS))
+def test_pdf_to_json_streams_pages(tmp_path, method):
+    """Test the streamed JSON document holds one entry per page."""
+    output_path = tmp_path / "sample.json"
+    
+    result = pdf_to_json(str(SAMPLE_PDF), str(output_path), method)
+    
+    data = json.loads(Path(result).read_text())
+    assert list(data) == ["page_1"]
+    assert "CDT Code: D0150" in data["page_1"]
+    assert "\r" not in data["page_1"]
+
+def test_pdf_to_json_invalid_method(tmp_path):
+    """Test an unknown method is rejected before any output is written."""
+    output_path = tmp_path / "sample.json"
+    
+    with pytest.raises(ValueError):
+        pdf_to_json(str(SAMPLE_PDF), str(output_path), "unknown")
+    assert not output_path.exists()
+
+@pytest.mark.asyncio
+async def test_processor_pdf_to_json_matches_module_output(tmp_path):
+    """Test PDFProcessor.pdf_to_json writes the same compact document as pdf_to_json."""
+    processor = PDFProcessor(cache_dir=str(tmp_path / "cache"))
+    
+    result = await processor.pdf_to_json(SAMPLE_PDF, str(tmp_path / "processor.json"), "pypdfium2")
+    expected = pdf_to_json(str(SAMPLE_PDF), str(tmp_path / "module.json"), "pypdfium2")
+    
+    assert Path(result).read_bytes() == Path(expected).read_bytes()
+
+def test_best_method_reserves_pdfplumber_for_ruled_pages(tmp_path):
+    """Test auto-selection only picks pdfplumber when the first page has table rulings."""
+    processor = PDFProcessor()
+    ruled_pdf = tmp_path / "ruled.pdf"
+    with pymupdf.open() as doc:
+        page = doc.new_page()
+        page.insert_text((72, 72), "Fee schedule")
+        for row in range(3):
+            for column in range(2):
+                page.draw_rect(pymupdf.Rect(72 + 100 * column, 100 + 20 * row, 172 + 100 * column, 120 + 20 * row))
+        doc.save(ruled_pdf)
+    decorated_pdf = tmp_path / "decorated.pdf"
+    with pymupdf.open() as doc:
+        page = doc.new_page()
+        page.insert_text((72, 72), "Guidelines")
+        page.draw_line((72, 75), (160, 75))
+        page.draw_rect(page.rect + (20, 20, -20, -20))
+        page.draw_circle((500, 60), 20)
+        doc.save(decorated_pdf)
+    
+    assert processor._determine_best_method(SAMPLE_PDF) == "pypdfium2"
+    assert processor._determine_best_method(ruled_pdf) == "pdfplumber"
+    assert processor._determine_best_method(decorated_pdf) == "pypdfium2"
+
+@pytest.mark.asyncio
+async def test_batch_process_uses_worker_pool_and_cache(tmp_path):
+    """Test batch conversion runs in the reused pool and fills the text cache."""
+    pdf_dir = tmp_path / "pdfs"
+    output_dir = tmp_path / "json"
+    pdf_dir.mkdir()
+    output_dir.mkdir()
+    (pdf_dir / "first.pdf").write_bytes(SAMPLE_PDF.read_bytes())
+    (pdf_dir / "second.pdf").write_bytes(SAMPLE_PDF.read_bytes() + b"\n")
+    processor = PDFProcessor(cache_dir=str(tmp_path / "cache"), max_workers=2)
+    expected = Path(pdf_to_json(str(SAMPLE_PDF), str(tmp_path / "expected.json"), "pypdfium2")).read_bytes()
+    
+    results = await processor.batch_process(pdf_dir, output_dir, "pypdfium2")
+    pool = processor._pool
+    cached_results = await processor.batch_process(pdf_dir, output_dir, "pypdfium2")
+    
+    assert sorted(Path(path).name for path in results) == ["first.json", "second.json"]
+    assert all(Path(path).read_bytes() == expected for path in results)
+    assert cached_results == results
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+    assert pool is not None and processor._pool is pool
+    processor.close()
+    assert processor._pool is None
+
+def test_pdfplumber_pages_split_across_workers(tmp_path):
+    """Test long documents parsed by several pdfplumber workers keep page order."""
+    pdf_path = tmp_path / "long.pdf"
+    with pymupdf.open() as doc:
+        for number in range(1, 21):
+            doc.new_page().insert_text((72, 72), f"Page number {number}")
+        doc.save(pdf_path)
+    
+    with patch("os.cpu_count", return_value=4), \
+         patch("dental_scraper.processors.pdf_processor.ProcessPoolExecutor", ThreadPoolExecutor):
+        pages = list(EXTRACTION_METHODS["pdfplumber"](str(pdf_path)))
+    
+    assert pages == [(number, f"Page number {number}") for number in range(1, 21)]
+
+def test_process_content_is_synchronous():
+    """Test page text is combined directly, in numeric page order."""
+    content = {"page_10": "ten", "page_2": "two"}
+    
+    assert PDFProcessor().process_content(content) == "two\n\nten\n\n"
+
+def test_performance_monitor_skips_memory_by_default():
+    """Test memory is only read from psutil when sampling is enabled."""
+    with patch("dental_scraper.processors.pdf_processor.psutil.Process") as process:
+        monitor = PerformanceMonitor()
+        monitor.start()
+        metrics = monitor.stop()
+    
+    process.assert_not_called()
+    assert metrics["memory_used"] == 0
+    assert metrics["execution_time"] >= 0
+
+def test_performance_monitor_samples_memory():
+    """Test an opted-in monitor reports the process memory."""
+    monitor = PerformanceMonitor(sample_memory=True)
+    monitor.start()
+    metrics = monitor.stop()
+    
+    assert metrics["peak_memory"] > 0
+
+@pytest.mark.asyncio
+async def test_pdf_to_json_reuses_pool_until_exit(tmp_path):
+    """Test conversions share one worker pool, shut down when the processor exits."""
+    async with PDFProcessor() as processor:
+        first = await processor.pdf_to_json(SAMPLE_PDF, str(tmp_path / "first.json"), "pypdfium2")
+        pool = processor._pool
+        second = await processor.pdf_to_json(SAMPLE_PDF, str(tmp_path / "second.json"), "pypdfium2")
+        
+        assert pool is not None and processor._pool is pool
+    
+    assert processor._pool is None
+    assert Path(first).read_bytes() == Path(second).read_bytes()
+    assert "CDT Code: D0150" in json.loads(Path(first).read_text())["page_1"]
@@ -7,6 +7,7 @@ from unittest.mock import patch, mock_open, MagicMock
 from pathlib import Path
 
 from scrapy.http import Request, Response, TextResponse, HtmlResponse
+from twisted.internet import defer
 from dental_scraper.scrapers.pdf_spider import PDFSpider
 
 @pytest.fixture
@@ -80,24 +81,26 @@ def test_parse_finds_pdf_links(spider, html_response):
     assert len(pagination_requests) == 1
     assert pagination_requests[0].url == "https://example.com/page2"
 
-def test_save_pdf(spider, pdf_response):
+@pytest.mark.asyncio
+async def test_save_pdf(spider, pdf_response, tmp_path):
     """Test saving a PDF file."""
-    # Mock the open function and file operations
-    with patch('builtins.open', mock_open()) as mock_file, \
+    spider.pdf_dir = str(tmp_path)
+    
+    # Run the threaded write inline so the test needs no reactor
+    with patch('dental_scraper.scrapers.pdf_spider.deferToThread',
+               side_effect=lambda f, *args: defer.succeed(f(*args))), \
          patch('os.makedirs') as mock_makedirs:
         
-        result = spider.save_pdf(pdf_response)
+        result = await spider.save_pdf(pdf_response)
         
-        # Verify file was opened for writing
-        mock_file.assert_called_once()
-        handle = mock_file()
-        handle.write.assert_called_once_with(pdf_response.body)
+        # Verify the body was written
+        assert (tmp_path / "document1.pdf").read_bytes() == pdf_response.body
         
-        # Verify parent directories were created
-        mock_makedirs.assert_called_once()
+        # Directories are created once in __init__, not per save
+        mock_makedirs.assert_not_called()
         
         # Verify the result contains expected information
         assert result["url"] == "https://example.com/document1.pdf"
         assert result["filename"] == "document1.pdf"
         assert os.path.join(spider.pdf_dir, "document1.pdf") in result["path"]
-        assert result["size"] == len(pdf_response.body) 
\ No newline at end of file
+        assert result["size"] == len(pdf_response.body) 
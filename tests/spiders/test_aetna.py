@@ -198,6 +198,28 @@ async def test_parse_pdf_download_failure(spider, mock_pdf_response):
                 # in the test itself since we're mocking at the save_pdf level
                 pass
 
+def test_parse_guidelines_filters_pdf_links(spider):
+    """Test that only PDF links with a relevant keyword are requested."""
+    html = b"""
+    <html>
+        <body>
+            <a href="/pdfs/Dental-Guidelines-2024.PDF">Guidelines</a>
+            <a href="/pdfs/form-123.pdf">Clinical Policy Bulletin</a>
+            <a href="/pdfs/other-document.pdf">Other Document</a>
+            <a href="/dental/resources">More Dental Resources</a>
+        </body>
+    </html>
+    """
+    url = 'https://www.aetna.com/health-care-professionals/dental-resources.html'
+    response = TextResponse(url=url, body=html, encoding='utf-8')
+    
+    urls = [request.url for request in spider.parse_guidelines(response)]
+    
+    assert urls == [
+        'https://www.aetna.com/pdfs/Dental-Guidelines-2024.PDF',
+        'https://www.aetna.com/pdfs/form-123.pdf'
+    ]
+
 def test_extract_procedures_empty_file(spider):
     """Test handling of empty PDF file."""
     with patch('pdfplumber.open', side_effect=Exception("Failed to open PDF")), \
@@ -216,6 +216,31 @@ def test_process_procedure_block_invalid_code(spider):
     assert result is None
     logger.info("Invalid procedure block test passed")
     
+def test_parse_procedure_blocks(spider):
+    logger.info("Testing parse method for procedure blocks")
+    html = b"""
+    <html>
+        <body>
+            <div class="procedure-block">
+                <h3>D0150 - Comprehensive oral evaluation</h3>
+                <a href="/docs/d0150.pdf">Guideline</a>
+            </div>
+            <div class="procedure-block">
+                <h3>Not a procedure</h3>
+                <a href="/docs/other.pdf">Other</a>
+            </div>
+        </body>
+    </html>
+    """
+    url = 'https://www.cigna.com/test'
+    response = TextResponse(url=url, body=html, encoding='utf-8', request=Request(url=url))
+    
+    results = [r for r in spider.parse(response) if r.meta.get('procedure_code')]
+    assert len(results) == 1
+    assert results[0].url == 'https://www.cigna.com/docs/d0150.pdf'
+    assert results[0].meta['procedure_name'] == 'Comprehensive oral evaluation'
+    logger.info("Procedure blocks test passed")
+    
 def test_find_table_info(spider):
     logger.info("Testing table info extraction")
     tables = [
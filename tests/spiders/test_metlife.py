@@ -232,4 +232,14 @@ def test_handle_error(spider):
     
     assert result is None
     
-    logger.info("Error handling test passed") 
\ No newline at end of file
+    logger.info("Error handling test passed")
+
+def test_spider_closed_shuts_down_pdf_processor(spider):
+    logger.info("Testing spider closed releases the PDF worker pool")
+    
+    with patch.object(spider.pdf_processor, 'close') as mock_close:
+        spider.closed(reason='finished')
+    
+    mock_close.assert_called_once()
+    
+    logger.info("Spider closed test passed")
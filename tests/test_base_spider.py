@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 import io
+import json
 
 from scrapy.http import Request, Response
 from scrapy.exceptions import CloseSpider
@@ -115,23 +116,20 @@ def test_save_metadata_success(spider):
     filename = 'test.json'
     
     # Mock the file operations
-    with patch('builtins.open', MagicMock(return_value=io.StringIO())) as mock_open:
-        with patch('json.dump') as mock_json_dump:
-            with patch('loguru.logger.info') as mock_logger:
-                result = spider.save_metadata(metadata, filename)
-                
-                # Verify the open operation was called
-                mock_open.assert_called_once()
-                
-                # Verify the json dump was called
-                mock_json_dump.assert_called_once()
-                
-                # Verify the logger was called
-                mock_logger.assert_called_once()
-                
-                # Verify the result is a Path
-                assert isinstance(result, Path)
-                assert result.name == filename
+    with patch('pathlib.Path.write_bytes') as mock_write:
+        with patch('loguru.logger.info') as mock_logger:
+            result = spider.save_metadata(metadata, filename)
+            
+            # Verify the serialized metadata was written
+            mock_write.assert_called_once()
+            assert json.loads(mock_write.call_args.args[0]) == metadata
+            
+            # Verify the logger was called
+            mock_logger.assert_called_once()
+            
+            # Verify the result is a Path
+            assert isinstance(result, Path)
+            assert result.name == filename
 
 def test_save_metadata_failure(spider):
     """Test error handling when saving metadata fails."""
@@ -140,6 +138,6 @@ def test_save_metadata_failure(spider):
     filename = 'test.json'
     
     # Mock the file operations to fail
-    with patch('builtins.open', side_effect=IOError("Open error")):
+    with patch('pathlib.Path.write_bytes', side_effect=IOError("Write error")):
         with pytest.raises(ScraperException):
             spider.save_metadata(metadata, filename) 
\ No newline at end of file
@@ -5,9 +5,11 @@ import pytest
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pdfplumber
+import pymupdf
 
 from dental_scraper.utils.pdf_processor import PDFProcessor
 from dental_scraper.exceptions import ParsingException
@@ -115,6 +117,49 @@ def test_extract_text_exception(mock_pdfplumber_open, pdf_processor, mock_pdf_pa
         pdf_processor.extract_text(mock_pdf_path)
 
 
+@pytest.fixture
+def long_pdf_path(tmp_path):
+    """Create a real PDF long enough for parallel text extraction."""
+    doc = pymupdf.open()
+    for i in range(20):
+        doc.new_page().insert_text((72, 72), f"D{1000 + i} page {i}")
+    pdf_path = tmp_path / 'long.pdf'
+    doc.save(pdf_path)
+    return pdf_path
+
+
+def test_extract_text_parallel_preserves_page_order(pdf_processor, long_pdf_path):
+    """Test that pages extracted by several workers are joined in order."""
+    with patch('os.cpu_count', return_value=4), \
+         patch('dental_scraper.utils.pdf_processor.ProcessPoolExecutor', ThreadPoolExecutor):
+        text = pdf_processor.extract_text(long_pdf_path)
+    
+    assert text.split('\n') == [f"D{1000 + i} page {i}" for i in range(20)]
+
+
+def test_extract_text_parallel_falls_back_to_serial(pdf_processor, long_pdf_path):
+    """Test that a failing worker pool falls back to serial extraction."""
+    with patch('os.cpu_count', return_value=4), \
+         patch('dental_scraper.utils.pdf_processor.ProcessPoolExecutor', side_effect=OSError("no pool")):
+        text = pdf_processor.extract_text(long_pdf_path)
+    
+    assert text.split('\n')[-1] == "D1019 page 19"
+
+
+def test_extract_text_fast_matches_extract_text(pdf_processor, long_pdf_path):
+    """Test that PDFium text uses the same line endings and page order as pdfplumber."""
+    text = pdf_processor.extract_text_fast(long_pdf_path)
+    
+    assert '\r' not in text
+    assert text == pdf_processor.extract_text(long_pdf_path)
+
+
+def test_extract_text_fast_exception(pdf_processor, tmp_path):
+    """Test error handling during PDFium text extraction."""
+    with pytest.raises(ParsingException):
+        pdf_processor.extract_text_fast(tmp_path / 'missing.pdf')
+
+
 @patch('pdfplumber.open')
 def test_extract_metadata_success(mock_pdfplumber_open, pdf_processor, mock_pdf_path, mock_pdf_metadata):
     """Test successful metadata extraction from a PDF."""
@@ -156,6 +201,33 @@ def test_extract_metadata_exception(mock_pdfplumber_open, pdf_processor, mock_pd
         pdf_processor.extract_metadata(mock_pdf_path)
 
 
+@patch('pdfplumber.open')
+def test_extract_all_single_open(mock_pdfplumber_open, pdf_processor, mock_pdf_path, mock_pdf_text):
+    """Test that text and metadata come from one parse of the PDF."""
+    mock_page = MagicMock()
+    mock_page.extract_text.return_value = mock_pdf_text
+    mock_pdf = MagicMock()
+    mock_pdf.pages = [mock_page, mock_page]
+    mock_pdf.metadata = {'Title': 'Test PDF Document'}
+    mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
+    
+    text, metadata = pdf_processor.extract_all(mock_pdf_path)
+    
+    mock_pdfplumber_open.assert_called_once_with(mock_pdf_path)
+    assert text == f"{mock_pdf_text}\n{mock_pdf_text}"
+    assert metadata['Title'] == 'Test PDF Document'
+    assert metadata['num_pages'] == 2
+
+
+@patch('pdfplumber.open')
+def test_extract_all_exception(mock_pdfplumber_open, pdf_processor, mock_pdf_path):
+    """Test error handling during combined extraction."""
+    mock_pdfplumber_open.side_effect = Exception("Test error")
+    
+    with pytest.raises(ParsingException):
+        pdf_processor.extract_all(mock_pdf_path)
+
+
 @patch('os.path.join', return_value='organized/test/path.pdf')
 @patch('os.makedirs')
 @patch('shutil.copy2')
@@ -180,50 +252,96 @@ def test_organize_by_provider(mock_copy2, mock_makedirs, mock_join, pdf_processo
 
 
 @patch('pdfplumber.open')
-@patch.object(PDFProcessor, 'extract_metadata')
 @patch.object(PDFProcessor, 'organize_by_provider')
-def test_process_pdf_success(mock_organize, mock_extract_metadata, mock_pdfplumber_open, pdf_processor, mock_pdf_path, mock_pdf_text, mock_pdf_metadata):
+def test_process_pdf_success(mock_organize, mock_pdfplumber_open, pdf_processor, mock_pdf_path, mock_pdf_text):
     """Test successful PDF processing."""
-    # Mock extract_text
+    # Mock the PDF object
     mock_page = MagicMock()
     mock_page.extract_text.return_value = mock_pdf_text
     mock_pdf = MagicMock()
     mock_pdf.pages = [mock_page]
+    mock_pdf.metadata = {'Title': 'Test PDF Document'}
     mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
     
-    # Mock extract_metadata
-    mock_extract_metadata.return_value = mock_pdf_metadata
-    
     # Mock organize_by_provider
     mock_organize.return_value = {
         'pdf_path': 'organized/test/path.pdf',
         'json_path': 'organized/test/path.json'
     }
     
-    # Process PDF
-    result = pdf_processor.process_pdf(mock_pdf_path, provider='test_provider')
+    # Process PDF, bypassing the extraction cache
+    with patch.object(Path, 'stat', return_value=MagicMock(st_size=1024)), \
+         patch.object(PDFProcessor, '_fingerprint', return_value=None):
+        result = pdf_processor.process_pdf(mock_pdf_path, provider='test_provider')
     
-    # Verify all steps were called
-    mock_extract_metadata.assert_called_once_with(mock_pdf_path)
+    # Verify the PDF was parsed once for both text and metadata
+    mock_pdfplumber_open.assert_called_once_with(mock_pdf_path)
     mock_organize.assert_called_once()
     
     # Verify result structure
     assert result['text_content'] == mock_pdf_text
-    assert result['metadata'] == mock_pdf_metadata
+    assert result['metadata']['Title'] == 'Test PDF Document'
+    assert result['metadata']['num_pages'] == 1
+    assert result['metadata']['file_size'] == 1024
+    assert result['metadata']['extracted_text'] == mock_pdf_text
     assert result['organized_paths'] == mock_organize.return_value
 
 
-@patch.object(PDFProcessor, 'extract_text')
-def test_process_pdf_exception(mock_extract_text, pdf_processor, mock_pdf_path):
+@patch('pdfplumber.open')
+def test_process_pdf_exception(mock_pdfplumber_open, pdf_processor, mock_pdf_path):
     """Test error handling during PDF processing."""
-    # Make extract_text raise an exception
-    mock_extract_text.side_effect = ParsingException("Test error")
+    # Make opening the PDF raise an exception
+    mock_pdfplumber_open.side_effect = Exception("Test error")
     
     # Attempt to process PDF and expect exception
     with pytest.raises(ParsingException):
         pdf_processor.process_pdf(mock_pdf_path, provider='test_provider')
 
 
+@patch('pdfplumber.open')
+def test_process_pdf_uses_extraction_cache(mock_pdfplumber_open, tmp_path, mock_pdf_text):
+    """Test that re-processing identical content is served from the cache."""
+    processor = PDFProcessor(base_dir=tmp_path / 'pdfs')
+    mock_page = MagicMock()
+    mock_page.extract_text.return_value = mock_pdf_text
+    mock_pdf = MagicMock()
+    mock_pdf.pages = [mock_page]
+    mock_pdf.metadata = {'Title': 'Test PDF Document'}
+    mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
+    
+    first = tmp_path / 'first.pdf'
+    second = tmp_path / 'second.pdf'
+    first.write_bytes(b'%PDF-1.4 same content')
+    second.write_bytes(b'%PDF-1.4 same content')
+    
+    processor.process_pdf(first, provider='aetna')
+    result = processor.process_pdf(second, provider='cigna')
+    
+    mock_pdfplumber_open.assert_called_once_with(first)
+    assert result['text_content'] == mock_pdf_text
+    assert result['metadata']['Title'] == 'Test PDF Document'
+    assert result['metadata']['file_name'] == 'second.pdf'
+    assert result['organized_paths']['pdf_path'] == tmp_path / 'pdfs' / 'cigna' / 'second.pdf'
+
+
+@patch('pdfplumber.open')
+@patch('dental_scraper.utils.pdf_processor.CACHE_MAX_ENTRIES', 2)
+def test_process_pdf_cache_eviction(mock_pdfplumber_open, tmp_path):
+    """Test that the extraction cache keeps only the newest entries."""
+    processor = PDFProcessor(base_dir=tmp_path / 'pdfs')
+    mock_pdf = MagicMock()
+    mock_pdf.pages = []
+    mock_pdf.metadata = {}
+    mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
+    
+    for i in range(3):
+        pdf_path = tmp_path / f'{i}.pdf'
+        pdf_path.write_bytes(f'%PDF-1.4 document {i}'.encode())
+        processor.process_pdf(pdf_path, provider='aetna')
+    
+    assert len(list(processor.cache_dir.glob('*.json'))) == 2
+
+
 @patch('builtins.open', new_callable=mock_open)
 @patch('json.dump')
 def test_save_metadata(mock_json_dump, mock_file_open, pdf_processor):
@@ -264,4 +382,25 @@ def test_extract_cdt_codes_with_pattern(mock_findall, pdf_processor):
     assert len(codes) == 2
     assert 'D0150' in codes
     assert 'D0210' in codes
-    mock_findall.assert_called_once() 
\ No newline at end of file
+    mock_findall.assert_called_once() 
+
+def test_split_procedure_blocks(pdf_processor):
+    """Test text is split into one block per CDT code, dropping any preamble."""
+    text = "Preamble\nD0150 Comprehensive oral evaluation\nRequirements:\n- New patient\nD0210 Intraoral series"
+    
+    blocks = pdf_processor._split_procedure_blocks(text)
+    
+    assert blocks == [
+        ("D0150", "D0150 Comprehensive oral evaluation\nRequirements:\n- New patient\n"),
+        ("D0210", "D0210 Intraoral series")
+    ]
+    assert pdf_processor._split_procedure_blocks("No codes here") == []
+
+
+def test_process_content_orders_pages_numerically(pdf_processor):
+    """Test pages are combined in numeric page order."""
+    content = {f"page_{number}": f"text {number}" for number in (10, 2, 1)}
+    
+    combined = pdf_processor.process_content(content)
+    
+    assert combined == "text 1\n\ntext 2\n\ntext 10\n\n"
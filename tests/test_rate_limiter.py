@@ -4,6 +4,7 @@ Unit tests for the rate limiting middleware.
 import pytest
 from unittest.mock import patch, MagicMock
 import time
+from twisted.internet.defer import succeed
 
 from dental_scraper.middlewares.rate_limiter import RateLimitMiddleware
 from dental_scraper.exceptions import RateLimitException
@@ -18,39 +19,41 @@ def rate_limiter():
 def test_init_default_values(rate_limiter):
     """Test initialization with default values."""
     assert rate_limiter.default_delay == 1.0
-    assert isinstance(rate_limiter.last_request_time, dict)
-    assert isinstance(rate_limiter.domain_delays, dict)
+    assert isinstance(rate_limiter._state, dict)
 
 
-@patch('time.sleep')
-def test_process_request(mock_sleep, rate_limiter):
+@pytest.mark.asyncio
+@patch('dental_scraper.middlewares.rate_limiter.deferLater', return_value=succeed(None))
+async def test_process_request(mock_defer_later, rate_limiter):
     """Test processing a request and enforcing delay."""
     # Create request with domain
     request = MagicMock()
     request.url = 'https://example.com/path'
+    rate_limiter._domain_state('example.com').last = time.time()
     
     # Process request
-    rate_limiter.process_request(request, None)
+    await rate_limiter.process_request(request, None)
     
     # Verify delay was applied
-    mock_sleep.assert_called_once()
-    assert 'example.com' in rate_limiter.last_request_time
+    mock_defer_later.assert_called_once()
+    assert 'example.com' in rate_limiter._state
 
 
-@patch('time.sleep')
-def test_process_request_no_delay_needed(mock_sleep, rate_limiter):
+@pytest.mark.asyncio
+@patch('dental_scraper.middlewares.rate_limiter.deferLater')
+async def test_process_request_no_delay_needed(mock_defer_later, rate_limiter):
     """Test processing a request when no delay is needed."""
-    # Set up a recent request time in the future
+    # Set up a request time well before the delay window
     request = MagicMock()
     request.url = 'https://example.com/path'
-    future_time = time.time() + 10  # 10 seconds in the future
-    rate_limiter.last_request_time['example.com'] = future_time
+    past_time = time.time() - 10  # 10 seconds ago
+    rate_limiter._domain_state('example.com').last = past_time
     
     # Process request
-    rate_limiter.process_request(request, None)
+    await rate_limiter.process_request(request, None)
     
     # Verify no delay was applied
-    mock_sleep.assert_not_called()
+    mock_defer_later.assert_not_called()
 
 
 def test_process_response_normal(rate_limiter):
@@ -79,7 +82,7 @@ def test_process_response_rate_limited(rate_limiter):
         rate_limiter.process_response(request, response, None)
     
     # Verify delay was increased
-    assert rate_limiter.domain_delays['example.com'] > rate_limiter.default_delay
+    assert rate_limiter._state['example.com'].delay > rate_limiter.default_delay
 
 
 def test_set_domain_delay(rate_limiter):
@@ -90,4 +93,4 @@ def test_set_domain_delay(rate_limiter):
     rate_limiter.set_domain_delay(domain, custom_delay)
     
     # Verify delay was set
-    assert rate_limiter.domain_delays[domain] == custom_delay 
\ No newline at end of file
+    assert rate_limiter._state[domain].delay == custom_delay 
\ No newline at end of file
@@ -2,10 +2,11 @@
 Tests for the download handler module.
 """
 import os
+import asyncio
 import pytest
 import aiohttp
 import datetime
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
 from pathlib import Path
 
 from dental_scraper.utils.download_handler import DownloadHandler
@@ -83,7 +84,7 @@ async def test_download_pdf_success(download_handler):
         # Return content first time, empty string second time
         mock_read.call_count = getattr(mock_read, 'call_count', 0) + 1
         if mock_read.call_count == 1:
-            return b'PDF content chunk 1'
+            return b'%PDF-1.4 content chunk 1'
         return b''
     
     mock_content.read = mock_read
@@ -128,26 +129,50 @@ async def test_download_pdf_failure_status(download_handler):
         assert result is None
 
 @pytest.mark.asyncio
-async def test_download_pdf_invalid_content_type(download_handler):
-    """Test PDF download failure due to invalid content type."""
+async def test_download_pdf_not_a_pdf(download_handler):
+    """Test PDF download failure when the body is not a PDF, whatever its content type."""
     test_url = "https://example.com/test.pdf"
     test_carrier = "Test Carrier"
     
-    # Mock the response with wrong content type
+    # Mock an HTML error page served as a binary download
     mock_response = MagicMock()
     mock_response.status = 200
-    mock_response.headers = {'Content-Type': 'text/html'}
+    mock_response.headers = {'Content-Type': 'application/octet-stream'}
+    mock_response.content.read = AsyncMock(side_effect=[b'<html>Error</html>', b''])
     
     # Mock the session
     mock_session = MagicMock()
     mock_session.__aenter__.return_value = mock_session
     mock_session.get.return_value.__aenter__.return_value = mock_response
     
-    with patch('aiohttp.ClientSession', return_value=mock_session):
+    with patch('aiohttp.ClientSession', return_value=mock_session), \
+         patch('builtins.open', mock_open()) as mock_file:
         result = await download_handler.download_pdf(test_url, test_carrier)
         
-        # Should return None for failure
+        # Should return None without writing anything or reading the rest of the body
         assert result is None
+        mock_file.assert_not_called()
+        assert mock_response.content.read.await_count == 1
+
+@pytest.mark.asyncio
+async def test_download_pdf_mislabeled_content_type(download_handler):
+    """Test that a PDF body is accepted even if served with a non-PDF content type."""
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.headers = {'Content-Type': 'text/html'}
+    mock_response.content.read = AsyncMock(side_effect=[b'%P', b'DF-1.4 body', b''])
+    
+    mock_session = MagicMock()
+    mock_session.__aenter__.return_value = mock_session
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    
+    with patch('aiohttp.ClientSession', return_value=mock_session), \
+         patch('builtins.open', mock_open()) as mock_file, \
+         patch('os.path.getsize', return_value=10240):
+        result = await download_handler.download_pdf("https://example.com/test.pdf", "Test Carrier")
+        
+        assert result is not None
+        mock_file().write.assert_called_once_with(b'%PDF-1.4 body')
 
 @pytest.mark.asyncio
 async def test_download_pdf_file_too_small(download_handler):
@@ -167,7 +192,7 @@ async def test_download_pdf_file_too_small(download_handler):
         # Return small content first time, empty string second time
         mock_read.call_count = getattr(mock_read, 'call_count', 0) + 1
         if mock_read.call_count == 1:
-            return b'Small content'
+            return b'%PDF-1.4 small'
         return b''
     
     mock_content.read = mock_read
@@ -190,6 +215,63 @@ async def test_download_pdf_file_too_small(download_handler):
         # Should return None for failure
         assert result is None
 
+@pytest.mark.asyncio
+async def test_download_pdf_reuses_session(download_handler):
+    """Test consecutive downloads share one HTTP session until closed."""
+    mock_response = MagicMock()
+    mock_response.status = 404
+    
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.close = AsyncMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    
+    with patch('aiohttp.ClientSession', return_value=mock_session) as mock_session_cls, \
+         patch('aiohttp.TCPConnector'):
+        await download_handler.download_pdf("https://example.com/a.pdf", "Test Carrier")
+        await download_handler.download_pdf("https://example.com/b.pdf", "Test Carrier")
+        await download_handler.close()
+    
+    mock_session_cls.assert_called_once()
+    assert mock_session.get.call_count == 2
+    mock_session.close.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_download_many_bounds_concurrency():
+    """Test batch downloads keep URL order and respect the concurrency limit."""
+    with patch('os.makedirs'):
+        handler = DownloadHandler(download_dir="/tmp/test_downloads", max_concurrency=2)
+    
+    in_flight = 0
+    peak = 0
+    
+    class MockGet:
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            mock_response = MagicMock()
+            mock_response.status = 404
+            return mock_response
+        
+        async def __aexit__(self, *exc_info):
+            nonlocal in_flight
+            in_flight -= 1
+    
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.get.side_effect = lambda url: MockGet()
+    
+    with patch('aiohttp.ClientSession', return_value=mock_session), \
+         patch('aiohttp.TCPConnector'):
+        urls = [f"https://example.com/{i}.pdf" for i in range(5)]
+        results = await handler.download_many(urls, "Test Carrier")
+    
+    assert results == [None] * 5
+    assert mock_session.get.call_count == 5
+    assert peak == 2
+
 @pytest.mark.asyncio
 async def test_cleanup_old_files(download_handler):
     """Test cleanup of old downloaded files."""
@@ -206,23 +288,17 @@ async def test_cleanup_old_files(download_handler):
     old_time = now - datetime.timedelta(days=10)
     new_time = now - datetime.timedelta(days=2)
     
-    with patch('os.listdir', return_value=test_files), \
-         patch('os.path.isfile', return_value=True), \
-         patch('os.path.getctime') as mock_getctime, \
-         patch('datetime.datetime') as mock_datetime, \
+    # Directory entries as returned by os.scandir, with cached stat results
+    entries = []
+    for path, file_time in zip(test_paths, (old_time, new_time)):
+        entry = MagicMock(path=path)
+        entry.is_file.return_value = True
+        entry.stat.return_value = MagicMock(st_ctime=file_time.timestamp())
+        entries.append(entry)
+    
+    with patch('os.scandir') as mock_scandir, \
          patch('os.remove') as mock_remove:
-        
-        # Setup the datetime.now mock
-        mock_datetime.now.return_value = now
-        mock_datetime.fromtimestamp.side_effect = lambda x: old_time if x == os.path.getctime(test_paths[0]) else new_time
-        
-        # Set ctime based on file
-        def mock_getctime_side_effect(path):
-            if path == test_paths[0]:
-                return old_time.timestamp()
-            return new_time.timestamp()
-            
-        mock_getctime.side_effect = mock_getctime_side_effect
+        mock_scandir.return_value.__enter__.return_value = iter(entries)
         
         # Run the cleanup
         await download_handler.cleanup_old_files(max_age_days=7)